@@ -4,16 +4,46 @@ Inquiro CLI - Local-first Interactive Research Assistant
 A beautiful command-line interface for document-based AI research
 """
 
+import io
+import itertools
 import os
+import sys
+import textwrap
+import threading
 import time
-from datetime import datetime
+from contextlib import contextmanager
 from typing import Optional, List
 
 import typer
 
-from .core.query import query_rag
+# The query pipeline (LangChain, Ollama, FAISS) takes most of a second to import, so it is
+# imported where it is first needed; --help, --version and the banner start instantly.
 from .core.config import FAISS_PATH, DATA_PATH
 
+# The database is ready once its index file exists (which implies FAISS_PATH does too)
+INDEX_FILE = str(FAISS_PATH / 'index.faiss')
+
+# File types counted as documents in the status display
+DOCUMENT_SUFFIXES = ('.pdf', '.txt', '.md')
+
+# Interactive commands by keyword (lowercase)
+COMMANDS = {
+    'quit': 'quit', 'exit': 'quit', 'q': 'quit',
+    'help': 'help', 'h': 'help',
+    'stats': 'stats', 's': 'stats',
+    'clear': 'clear', 'c': 'clear',
+    'reload': 'reload', 'r': 'reload',
+}
+
+# System stats are reused for this many seconds, see get_system_stats()
+STATS_CACHE_SECONDS = 2.0
+_stats_cache = {'time': 0.0, 'stats': None}
+
+# Terminal output is collected here and written in one call by flush_output()
+_output = io.StringIO()
+
+# Answers are wrapped at 70 characters, only breaking between words
+_ANSWER_WRAPPER = textwrap.TextWrapper(width=70, break_long_words=False, break_on_hyphens=False)
 
 # Color codes for beautiful terminal output
 class Colors:
@@ -56,30 +86,73 @@ class Colors:
     BG_WHITE = '\033[47m'
 
 
+# Plain text when output is redirected to a file or pipe (or NO_COLOR is set)
+if not sys.stdout.isatty() or os.getenv("NO_COLOR"):
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+
 def print_colored(text: str, color: str = Colors.RESET, end: str = '\n') -> None:
-    """Print text with color and reset to normal."""
-    print(f"{color}{text}{Colors.RESET}", end=end)
+    """
+    Print text with color and reset to normal.
+    
+    The text is buffered until the next flush_output(), so a whole screen of output
+    (banner, help, an answer) reaches the terminal in a single write.
+    """
+    _output.write(color)
+    _output.write(text)
+    _output.write(Colors.RESET)
+    _output.write(end)
+
+
+def flush_output() -> None:
+    """Write all buffered output to the terminal."""
+    sys.stdout.write(_output.getvalue())
+    sys.stdout.flush()
+    _output.seek(0)
+    _output.truncate()
+
+
+def _colored(text: str, color: str) -> str:
+    """Return a line of text with color codes, as print_colored() writes it."""
+    return f"{color}{text}{Colors.RESET}\n"
+
+
+# Separator lines by width
+_RULES = {width: _colored("─" * width, Colors.DIM) for width in (30, 40, 50, 60)}
+
+_BANNER_LINES = [
+    "██╗███╗   ██╗ ██████╗ ██╗   ██╗██╗██████╗  ██████╗ ",
+    "██║████╗  ██║██╔═══██╗██║   ██║██║██╔══██╗██╔═══██╗",
+    "██║██╔██╗ ██║██║   ██║██║   ██║██║██████╔╝██║   ██║",
+    "██║██║╚██╗██║██║▄▄ ██║██║   ██║██║██╔══██╗██║   ██║",
+    "██║██║ ╚████║╚██████╔╝╚██████╔╝██║██║  ██║╚██████╔╝",
+    "╚═╝╚═╝  ╚═══╝ ╚══▀▀═╝  ╚═════╝ ╚═╝╚═╝  ╚═╝ ╚═════╝ "
+]
+_BANNER_COLORS = [Colors.BRIGHT_CYAN, Colors.CYAN, Colors.BLUE, Colors.BRIGHT_BLUE, Colors.MAGENTA, Colors.BRIGHT_MAGENTA]
+
+# The banner and help screen never change, so they are rendered once
+_BANNER = "\n" + "".join(
+    _colored(line.center(80), _BANNER_COLORS[i % len(_BANNER_COLORS)]) for i, line in enumerate(_BANNER_LINES)
+) + _colored("🔬 AI-Powered Document Research Assistant", Colors.BRIGHT_WHITE) + _colored("━" * 50, Colors.DIM)
+
+_HELP = "".join([
+    _colored("\n🆘 Available Commands", Colors.BRIGHT_YELLOW),
+    _RULES[50],
+    _colored("📝 Just type your question naturally", Colors.WHITE),
+    _colored("🔄 'reload' or 'r'  - Reload database", Colors.CYAN),
+    _colored("📊 'stats' or 's'   - Show system stats", Colors.CYAN),
+    _colored("🆘 'help' or 'h'    - Show this help", Colors.CYAN),
+    _colored("🚪 'quit' or 'q'    - Exit Inquiro", Colors.CYAN),
+    _colored("🧹 'clear' or 'c'   - Clear screen", Colors.CYAN),
+    "\n",
+])
 
 
 def print_gradient_banner():
     """Print a beautiful gradient banner."""
-    banner_lines = [
-        "██╗███╗   ██╗ ██████╗ ██╗   ██╗██╗██████╗  ██████╗ ",
-        "██║████╗  ██║██╔═══██╗██║   ██║██║██╔══██╗██╔═══██╗",
-        "██║██╔██╗ ██║██║   ██║██║   ██║██║██████╔╝██║   ██║",
-        "██║██║╚██╗██║██║▄▄ ██║██║   ██║██║██╔══██╗██║   ██║",
-        "██║██║ ╚████║╚██████╔╝╚██████╔╝██║██║  ██║╚██████╔╝",
-        "╚═╝╚═╝  ╚═══╝ ╚══▀▀═╝  ╚═════╝ ╚═╝╚═╝  ╚═╝ ╚═════╝ "
-    ]
-    
-    colors = [Colors.BRIGHT_CYAN, Colors.CYAN, Colors.BLUE, Colors.BRIGHT_BLUE, Colors.MAGENTA, Colors.BRIGHT_MAGENTA]
-    
-    print()
-    for i, line in enumerate(banner_lines):
-        print_colored(line.center(80), colors[i % len(colors)])
-    
-    print_colored("🔬 AI-Powered Document Research Assistant", Colors.BRIGHT_WHITE)
-    print_colored("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", Colors.DIM)
+    _output.write(_BANNER)
+    flush_output()
 
 
 def print_stats():
@@ -87,7 +160,7 @@ def print_stats():
     stats = get_system_stats()
     
     print_colored("\n📊 System Status", Colors.BRIGHT_YELLOW)
-    print_colored("─" * 50, Colors.DIM)
+    _output.write(_RULES[50])
     
     # Database status
     if stats['database_ready']:
@@ -101,114 +174,144 @@ def print_stats():
     # Storage location
     print_colored(f"💾 Storage: {DATA_PATH}", Colors.DIM)
     
-    print()
+    print_colored("")
+    flush_output()
 
 
 def get_system_stats() -> dict:
-    """Get current system statistics."""
+    """
+    Get current system statistics.
+    
+    The result is cached for STATS_CACHE_SECONDS, so redrawing the banner right after
+    the stats were shown doesn't rescan the data directory. 'reload' clears the cache.
+    """
+    now = time.monotonic()
+    if _stats_cache['stats'] is not None and now - _stats_cache['time'] < STATS_CACHE_SECONDS:
+        return _stats_cache['stats']
+    
     stats = {
-        'database_ready': os.path.exists(FAISS_PATH) and os.path.exists(os.path.join(FAISS_PATH, 'index.faiss')),
+        'database_ready': os.path.exists(INDEX_FILE),
         'documents': 0,
         'chunks': 0
     }
     
-    # Count documents
-    if os.path.exists(DATA_PATH):
-        files = [f for f in os.listdir(DATA_PATH) if f.endswith(('.pdf', '.txt', '.md'))]
-        stats['documents'] = len(files)
+    # Count documents; is_file() uses the file type from the directory listing, no stat per entry
+    if DATA_PATH.exists():
+        with os.scandir(DATA_PATH) as entries:
+            stats['documents'] = sum(1 for e in entries if e.name.endswith(DOCUMENT_SUFFIXES) and e.is_file())
     
-    # Estimate chunks (rough calculation)
+    # Count chunks from the memory-mapped index header
     if stats['database_ready']:
-        # This is a rough estimate - actual chunk count would require loading the DB
-        stats['chunks'] = stats['documents'] * 30  # Average chunks per document
+        try:
+            from .core.vectorstore import count_vectors
+            stats['chunks'] = count_vectors()
+        except Exception:
+            stats['chunks'] = stats['documents'] * 30  # Rough estimate if the index can't be read
     
+    _stats_cache.update(time=now, stats=stats)
     return stats
 
 
 def show_typing_animation(text: str, delay: float = 0.03):
-    """Show typing animation for text."""
+    """
+    Show typing animation for text.
+    
+    The color is set once for the whole text. When output isn't a terminal the text
+    is written at once, without the per-character delay.
+    """
+    if not sys.stdout.isatty():
+        print_colored(text, Colors.BRIGHT_GREEN)
+        flush_output()
+        return
+    
+    flush_output()
+    sys.stdout.write(Colors.BRIGHT_GREEN)
     for char in text:
-        print_colored(char, Colors.BRIGHT_GREEN, end='')
+        sys.stdout.write(char)
+        sys.stdout.flush()
         time.sleep(delay)
-    print()
+    sys.stdout.write(Colors.RESET + "\n")
+    sys.stdout.flush()
 
 
-def show_thinking_animation(duration: float = 2.0):
-    """Show a thinking animation."""
+def _animate_thinking(stop: threading.Event):
+    """Animate the thinking indicator until stop is set."""
     thinking_chars = ['🤔', '💭', '🧠', '⚡', '🔍', '📖']
-    end_time = time.time() + duration
     
     print_colored("\n", end='')
-    while time.time() < end_time:
-        for char in thinking_chars:
-            if time.time() >= end_time:
-                break
-            print_colored(f"\r{char} Analyzing documents...", Colors.YELLOW, end='')
-            time.sleep(0.2)
+    for char in itertools.cycle(thinking_chars):
+        print_colored(f"\r{char} Analyzing documents...", Colors.YELLOW, end='')
+        flush_output()
+        if stop.wait(0.2):
+            break
     
     print_colored("\r✨ Found relevant information!     ", Colors.GREEN)
+    flush_output()
+
+
+@contextmanager
+def show_thinking_animation():
+    """
+    Show a thinking animation while the body of the with-block runs.
+    
+    The animation runs on its own thread and stops as soon as the body finishes, so it
+    covers the query's latency instead of adding to it. Skipped when output isn't a terminal.
+    """
+    if not sys.stdout.isatty():
+        yield
+        return
+    
+    stop = threading.Event()
+    animation = threading.Thread(target=_animate_thinking, args=(stop,), daemon=True)
+    animation.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        animation.join()
 
 
 def print_help():
     """Print help information."""
-    print_colored("\n🆘 Available Commands", Colors.BRIGHT_YELLOW)
-    print_colored("─" * 50, Colors.DIM)
-    print_colored("📝 Just type your question naturally", Colors.WHITE)
-    print_colored("🔄 'reload' or 'r'  - Reload database", Colors.CYAN)
-    print_colored("📊 'stats' or 's'   - Show system stats", Colors.CYAN)
-    print_colored("🆘 'help' or 'h'    - Show this help", Colors.CYAN)
-    print_colored("🚪 'quit' or 'q'    - Exit Inquiro", Colors.CYAN)
-    print_colored("🧹 'clear' or 'c'   - Clear screen", Colors.CYAN)
-    print()
+    _output.write(_HELP)
+    flush_output()
 
 
 def clear_screen():
-    """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen (and scrollback) with ANSI codes, like `clear` does."""
+    if sys.stdout.isatty():
+        _output.write("\033[H\033[2J\033[3J")
+    flush_output()
 
 
 def format_response(response: str, sources: List[str]) -> None:
     """Format and display the response beautifully."""
     print_colored("\n✨ Answer", Colors.BRIGHT_GREEN)
-    print_colored("─" * 60, Colors.DIM)
+    _output.write(_RULES[60])
     
     # Word wrap for better readability
-    words = response.split()
-    line = ""
-    for word in words:
-        if len(line + word) > 70:  # Line wrap at 70 characters
-            print_colored(line.strip(), Colors.WHITE)
-            line = word + " "
-        else:
-            line += word + " "
-    
-    if line.strip():
-        print_colored(line.strip(), Colors.WHITE)
+    wrapped = _ANSWER_WRAPPER.fill(" ".join(response.split()))
+    if wrapped:
+        print_colored(wrapped, Colors.WHITE)
     
     # Show sources if available
     if sources:
         print_colored(f"\n📚 Sources ({len(sources)} documents)", Colors.BRIGHT_BLUE)
-        print_colored("─" * 30, Colors.DIM)
-        seen_files = set()
-        source_count = 0
+        _output.write(_RULES[30])
         
-        for source in sources:
-            if ':' in source:
-                # Extract just filename from full path
-                filepath = source.split(':')[0]
-                filename = os.path.basename(filepath)
-            else:
-                filename = source
-            
-            # Only show unique filenames
-            if filename not in seen_files:
-                seen_files.add(filename)
-                source_count += 1
-                if source_count <= 3:  # Show first 3 unique files
-                    print_colored(f"{source_count}. {filename}", Colors.BLUE)
+        # Chunk ids are "<source>:<page>:<chunk>"; keep just the filename, each file once
+        filenames = list(dict.fromkeys(
+            os.path.basename(source.rsplit(':', 2)[0]) if ':' in source else source
+            for source in sources
+        ))
+        
+        for i, filename in enumerate(filenames[:3], 1):  # Show first 3 unique files
+            print_colored(f"{i}. {filename}", Colors.BLUE)
         
-        if len(seen_files) > 3:
-            print_colored(f"   ... and {len(seen_files) - 3} more", Colors.DIM)
+        if len(filenames) > 3:
+            print_colored(f"   ... and {len(filenames) - 3} more", Colors.DIM)
+    
+    flush_output()
 
 
 def print_banner():
@@ -220,9 +323,9 @@ def print_banner():
 
 def check_database() -> bool:
     """Check if FAISS database exists with nice formatting."""
-    if not os.path.exists(FAISS_PATH):
+    if not os.path.exists(INDEX_FILE):
         print_colored("\n❌ Database Not Ready", Colors.BRIGHT_RED)
-        print_colored("─" * 40, Colors.DIM)
+        _output.write(_RULES[40])
         print_colored("The vector database hasn't been created yet.", Colors.WHITE)
         print_colored("\n🔧 To get started:", Colors.BRIGHT_YELLOW)
         print_colored("1. Add PDF files to: ", Colors.WHITE, end='')
@@ -230,6 +333,7 @@ def check_database() -> bool:
         print_colored("2. Run: ", Colors.WHITE, end='')
         print_colored("python populate_database.py", Colors.GREEN)
         print_colored("\nThis will process your documents and create the database.", Colors.DIM)
+        flush_output()
         return False
     return True
 
@@ -252,44 +356,52 @@ def interactive_mode():
     while True:
         try:
             # Create a nice prompt
-            timestamp = datetime.now().strftime("%H:%M")
+            timestamp = time.strftime("%H:%M")
             print_colored(f"\n[{timestamp}] ", Colors.DIM, end='')
             print_colored("❓ Your question: ", Colors.BRIGHT_CYAN, end='')
+            flush_output()
             
-            question = input().strip()
+            # The prompt is already written, so read the line directly; '' means EOF (Ctrl+D, end of piped input)
+            line = sys.stdin.readline()
+            if not line:
+                print_colored("\n👋 Thanks for using Inquiro! Goodbye!", Colors.BRIGHT_MAGENTA)
+                break
+            question = line.strip()
             
             if not question:
                 continue
             
             # Handle commands
-            if question.lower() in ['quit', 'exit', 'q']:
+            command = COMMANDS.get(question.lower())
+            if command == 'quit':
                 print_colored("\n👋 Thanks for using Inquiro! Goodbye!", Colors.BRIGHT_MAGENTA)
                 break
             
-            elif question.lower() in ['help', 'h']:
+            elif command == 'help':
                 print_help()
                 continue
             
-            elif question.lower() in ['stats', 's']:
+            elif command == 'stats':
                 print_stats()
                 continue
             
-            elif question.lower() in ['clear', 'c']:
+            elif command == 'clear':
                 print_banner()
                 continue
             
-            elif question.lower() in ['reload', 'r']:
+            elif command == 'reload':
                 print_colored("\n🔄 Reloading system...", Colors.YELLOW)
+                _stats_cache['stats'] = None
                 if check_database():
                     print_colored("✅ System reloaded successfully!", Colors.GREEN)
                 continue
             
             # Process the question
             question_count += 1
-            show_thinking_animation(1.5)
-            
             try:
-                result = query_rag(question)
+                with show_thinking_animation():
+                    from .core.query import query_rag
+                    result = query_rag(question, quiet=True)
                 
                 if result and isinstance(result, dict):
                     response_text = str(result.get("answer", ""))
@@ -323,10 +435,10 @@ def single_question_mode(question: str):
     print_colored(f"\n❓ Question: ", Colors.BRIGHT_CYAN, end='')
     print_colored(f'"{question}"', Colors.WHITE)
     
-    show_thinking_animation(1.0)
-    
     try:
-        result = query_rag(question)
+        with show_thinking_animation():
+            from .core.query import query_rag
+            result = query_rag(question, quiet=True)
         
         if result and isinstance(result, dict):
             response_text = str(result.get("answer", ""))
@@ -346,6 +458,7 @@ def version_callback(value: bool):
     if value:
         print_colored("Inquiro CLI v1.0.0", Colors.BRIGHT_CYAN)
         print_colored("🔬 AI-Powered Document Research Assistant", Colors.DIM)
+        flush_output()
         raise typer.Exit()
 
 @app.callback(invoke_without_command=True)
@@ -364,14 +477,23 @@ def cli(
     if ctx.invoked_subcommand is not None:
         return
 
-    if question:
-        question_text = " ".join(question)
-        single_question_mode(question_text)
-    else:
-        interactive_mode()
+    try:
+        if question:
+            question_text = " ".join(question)
+            single_question_mode(question_text)
+        else:
+            interactive_mode()
+    finally:
+        flush_output()
 
 
 def main():
+    # All CLI output is flushed explicitly (see flush_output()), so line buffering on a
+    # terminal would only add a write() per line, e.g. for messages from the query pipeline
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    if os.name == 'nt':
+        os.system('')  # Enables ANSI escape codes (colors, clear screen) in the Windows console
     app()
 
 
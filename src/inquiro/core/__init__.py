@@ -16,14 +16,36 @@ embedding.py:
     Embedding function factory providing consistent access to Ollama embedding models.
     Abstracts embedding generation for use across the system.
 
+embed_cache.py:
+    Content-addressed SQLite cache wrapped around the embedding model, so only text
+    that was never embedded before is sent to Ollama.
+
 database.py:
     Document ingestion and vector database population. Handles PDF loading, text chunking,
     embedding generation, and FAISS index creation/updating with intelligent reset logic.
 
+manifest.py:
+    Record of ingested files (mtime, size, content digest), used by incremental updates
+    to skip unchanged files and replace the chunks of modified ones.
+
 query.py:
     RAG query processing with configurable retrieval parameters. Provides command-line
     interface for querying the knowledge base with similarity filtering and verbose output.
 
+splitting.py:
+    Text splitter selection. Recursive character chunking by default (measured in
+    tokens when CHUNK_SPLITTER is "recursive_token"), or fast fixed-size token
+    windows when CHUNK_SPLITTER is "token".
+
+vectorstore.py:
+    FAISS index management. Builds cosine-similarity stores, optionally converts large flat
+    indices to a compressed index (e.g. IVF-PQ) before saving and applies search-time
+    parameters after loading.
+
+semantic_cache.py:
+    Semantic answer cache. Serves answers to questions that are near-duplicates of
+    previously answered ones, skipping retrieval and generation.
+
 Key Features:
 ------------
 - Modular architecture with clear separation of concerns
@@ -43,34 +65,54 @@ Dependencies:
 - PyMuPDF: PDF document processing
 """
 
-# Core configuration and paths
-from .config import (
-    DATA_PATH, 
-    FAISS_PATH, 
-    INQUIRO_BASE_DIR,
-    OLLAMA_QUERY_MODEL,
-    OLLAMA_EMBEDDING_MODEL,
-    DEFAULT_K,
-    DEFAULT_SCORE_THRESHOLD,
-    validate_system,
-    get_config_summary
-)
-
-# Embedding functionality
-from .embedding import get_embedding
-
-# Database population functions
-from .database import (
-    main as populate_database, 
-    clear_database, 
-    load_documents, 
-    split_documents, 
-    add_to_faiss,
-    determine_reset_behavior
-)
-
-# Query processing
-from .query import query_rag
+import importlib
+
+# Public name -> (submodule, attribute). Submodules are imported on first access (PEP 562),
+# so importing inquiro.core does not pull in LangChain, FAISS or PyMuPDF until they are used.
+_LAZY_EXPORTS = {
+    # Core configuration and paths
+    'DATA_PATH': ('config', 'DATA_PATH'),
+    'FAISS_PATH': ('config', 'FAISS_PATH'),
+    'INQUIRO_BASE_DIR': ('config', 'INQUIRO_BASE_DIR'),
+    'OLLAMA_QUERY_MODEL': ('config', 'OLLAMA_QUERY_MODEL'),
+    'OLLAMA_EMBEDDING_MODEL': ('config', 'OLLAMA_EMBEDDING_MODEL'),
+    'DEFAULT_K': ('config', 'DEFAULT_K'),
+    'DEFAULT_SCORE_THRESHOLD': ('config', 'DEFAULT_SCORE_THRESHOLD'),
+    'validate_system': ('config', 'validate_system'),
+    'get_config_summary': ('config', 'get_config_summary'),
+    'render_prompt': ('config', 'render_prompt'),
+    
+    # Embedding functionality
+    'get_embedding': ('embedding', 'get_embedding'),
+    
+    # Database population functions
+    'populate_database': ('database', 'main'),
+    'clear_database': ('database', 'clear_database'),
+    'load_documents': ('database', 'load_documents'),
+    'split_documents': ('database', 'split_documents'),
+    'add_to_faiss': ('database', 'add_to_faiss'),
+    'determine_reset_behavior': ('database', 'determine_reset_behavior'),
+    
+    # Query processing
+    'query_rag': ('query', 'query_rag'),
+    'query_rag_batch': ('query', 'query_rag_batch'),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # Public API
 __all__ = [
@@ -84,6 +126,7 @@ __all__ = [
     'DEFAULT_SCORE_THRESHOLD',
     'validate_system',
     'get_config_summary',
+    'render_prompt',
     
     # Embedding
     'get_embedding',
@@ -97,5 +140,6 @@ __all__ = [
     'determine_reset_behavior',
     
     # Querying
-    'query_rag'
+    'query_rag',
+    'query_rag_batch'
 ]
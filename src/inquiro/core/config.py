@@ -7,21 +7,53 @@ Variables:
 - INQUIRO_BASE_DIR: Root directory for Inquiro data (OS-dependent).
 - DATA_PATH: Directory for storing data files.
 - FAISS_PATH: Directory for storing FAISS vector database indices.
+- CACHE_PATH: Directory for on-disk caches (embeddings, answers).
+- MOVE_ON_ADD: Whether documents added in the TUI are moved into DATA_PATH rather than copied.
+- OLLAMA_BASE_URL: URL of the Ollama server.
 - OLLAMA_QUERY_MODEL: Default model used for answering queries.
 - OLLAMA_EMBEDDING_MODEL: Default model used for generating embeddings.
+- EMBED_BATCH_SIZE: Number of texts sent to Ollama per embedding request.
+- EMBED_CONCURRENCY: Number of embedding requests sent to Ollama concurrently.
+- EMBEDDING_CACHE: Whether computed embeddings are memoized on disk.
 - CHUNK_SIZE: Size of text chunks for document splitting.
 - CHUNK_OVERLAP: Overlap between consecutive chunks.
+- CHUNK_SPLITTER: Chunking strategy ("recursive" characters, "recursive_token" or "token" windows).
+- PDF_LOAD_WORKERS: Number of processes used to load PDFs (0 means one per CPU core).
+- FAISS_MMAP: Whether the index is memory-mapped instead of read into RAM when querying.
+- FAISS_USE_GPU / FAISS_GPU_FP16: Whether queries search on a GPU, and whether it uses half precision.
+- FAISS_GPU_MIN_VECTORS: Index size below which GPU search is skipped.
+- FAISS_INDEX_TYPE: Index layout for large collections ("flat" by default, or "ivfpq", "sq8", "sqfp16").
+- IVF_THRESHOLD: Number of vectors above which a compressed index is built.
+- FAISS_NLIST / FAISS_NPROBE / FAISS_PQ_M: IVF-PQ build and search parameters.
 - DEFAULT_K: Default number of documents to retrieve.
-- DEFAULT_SCORE_THRESHOLD: Minimum similarity score for retrieval.
+- DEFAULT_SCORE_THRESHOLD: Minimum cosine similarity for retrieval.
 - DEFAULT_MAX_CONTEXT_LENGTH: Maximum context length for LLM input.
-- PROMPT_TEMPLATE: Template for RAG prompts.
+- PROMPT_TEMPLATE: Template for RAG prompts (rendered with render_prompt()).
+- SEMANTIC_CACHE: Whether answers to similar questions are served from cache.
+- SEMANTIC_CACHE_THRESHOLD: Minimum cosine similarity for a semantic cache hit.
+- SEMANTIC_CACHE_TTL_DAYS: Age after which cached answers expire (0 means never).
 '''
 
+import functools
 import os
+import string
 import subprocess
 import platformdirs
 from pathlib import Path
 
+
+def _env_int(name, default):
+    """Read an integer environment variable, using the typed default when it is unset."""
+    value = os.environ.get(name)
+    return int(value) if value is not None else default
+
+
+def _env_float(name, default):
+    """Read a float environment variable, using the typed default when it is unset."""
+    value = os.environ.get(name)
+    return float(value) if value is not None else default
+
+
 """App Data storage configs"""
 # Base directory for all Inquiro data storage based on the operating system
 INQUIRO_BASE_DIR = Path(platformdirs.user_data_dir(appname="inquiro", appauthor="ADPer"))
@@ -29,11 +61,20 @@ INQUIRO_BASE_DIR = Path(platformdirs.user_data_dir(appname="inquiro", appauthor=
 # Data storage directories
 DATA_PATH = Path.joinpath(INQUIRO_BASE_DIR, "data")
 FAISS_PATH = Path.joinpath(INQUIRO_BASE_DIR, "database", "faiss_index")
+CACHE_PATH = Path.joinpath(INQUIRO_BASE_DIR, "cache")
+
+# Move documents added in the TUI into DATA_PATH instead of copying them, when they are on the same drive
+MOVE_ON_ADD = os.getenv("MOVE_ON_ADD", "false").lower() == "true"
 
 """LLM configs"""
-# Default ollama model configuration (can be overridden with environment variables)
+# Ollama server and default model configuration (can be overridden with environment variables)
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_QUERY_MODEL = os.getenv("OLLAMA_QUERY_MODEL", "CognitiveComputations/dolphin-mistral:7b")
 OLLAMA_EMBEDDING_MODEL = os.getenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text")
+EMBED_BATCH_SIZE = _env_int("EMBED_BATCH_SIZE", 64)                                # Texts per embedding request
+EMBED_CONCURRENCY = _env_int("EMBED_CONCURRENCY", 4)                               # Embedding requests in flight at once
+EMBEDDING_CACHE = os.getenv("EMBEDDING_CACHE", "true").lower() == "true"            # Reuse embeddings of unchanged text
+EMBEDDING_CACHE_PATH = Path.joinpath(CACHE_PATH, "embeddings.sqlite3")
 
 # Prompt template for RAG queries
 PROMPT_TEMPLATE = os.getenv("PROMPT_TEMPLATE", """
@@ -47,31 +88,145 @@ Answer the question based on the above context: {question}
 """)
 
 # Query/RAG configuration
-DEFAULT_K = int(os.getenv("DEFAULT_K", "7"))                                       # Number of documents to retrieve
-DEFAULT_SCORE_THRESHOLD = float(os.getenv("DEFAULT_SCORE_THRESHOLD", "0.4"))       # Minimum similarity score threshold
-DEFAULT_MAX_CONTEXT_LENGTH = int(os.getenv("DEFAULT_MAX_CONTEXT_LENGTH", "6000"))  # Maximum context length in characters
+DEFAULT_K = _env_int("DEFAULT_K", 7)                                               # Number of documents to retrieve
+DEFAULT_SCORE_THRESHOLD = _env_float("DEFAULT_SCORE_THRESHOLD", 0.4)               # Minimum cosine similarity threshold
+DEFAULT_MAX_CONTEXT_LENGTH = _env_int("DEFAULT_MAX_CONTEXT_LENGTH", 6000)          # Maximum context length in characters
+
+# Semantic answer cache configuration
+SEMANTIC_CACHE = os.getenv("SEMANTIC_CACHE", "true").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = _env_float("SEMANTIC_CACHE_THRESHOLD", 0.92)            # Minimum cosine similarity for a hit
+SEMANTIC_CACHE_TTL_DAYS = _env_float("SEMANTIC_CACHE_TTL_DAYS", 7.0)                # 0 means cached answers never expire
+SEMANTIC_CACHE_PATH = Path.joinpath(CACHE_PATH, "qa.jsonl")
 
 """Chunking configs"""
 # Text chunking configuration
-CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "800"))
-CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "80"))
+CHUNK_SIZE = _env_int("CHUNK_SIZE", 800)
+CHUNK_OVERLAP = _env_int("CHUNK_OVERLAP", 80)
+CHUNK_SPLITTER = os.getenv("CHUNK_SPLITTER", "recursive").lower()                  # "recursive", "recursive_token" or "token" (needs tiktoken)
 
 """Other required configs"""
 # FAISS configuration
 FAISS_ALLOW_DANGEROUS_DESERIALIZATION = os.getenv("FAISS_ALLOW_DANGEROUS_DESERIALIZATION", "true").lower() == "true"
+FAISS_MMAP = os.getenv("FAISS_MMAP", "true").lower() == "true"                     # Memory-map the index when querying
+FAISS_USE_GPU = os.getenv("FAISS_USE_GPU", "false").lower() == "true"              # Search on GPU when querying (faiss-gpu)
+FAISS_GPU_FP16 = os.getenv("FAISS_GPU_FP16", "true").lower() == "true"             # Half-precision GPU storage/lookup tables
+FAISS_GPU_MIN_VECTORS = _env_int("FAISS_GPU_MIN_VECTORS", 1_000_000)              # Smaller indices are searched on CPU
+FAISS_INDEX_TYPE = os.getenv("FAISS_INDEX_TYPE", "flat").lower()                   # "flat" (exact), "ivfpq", "sq8" or "sqfp16"
+IVF_THRESHOLD = _env_int("IVF_THRESHOLD", 5000)                                    # Vectors needed before compressing
+FAISS_NLIST = _env_int("FAISS_NLIST", 0)                                           # IVF cells, 0 means ~4*sqrt(N)
+FAISS_NPROBE = _env_int("FAISS_NPROBE", 16)                                        # IVF cells visited per query
+FAISS_PQ_M = _env_int("FAISS_PQ_M", 48)                                            # PQ sub-quantizers per vector
+
+# Skip the embedding and model probes in validate_system() (e.g. in CI without Ollama)
+SKIP_PROBE = os.getenv("INQUIRO_SKIP_PROBE", "false").lower() in ("1", "true")
 
 # Memory optimization configuration
-DEFAULT_MEMORY_LIMIT = int(os.getenv("DEFAULT_MEMORY_LIMIT", "8000"))              # In MB, 0 means no limit
+DEFAULT_MEMORY_LIMIT = _env_int("DEFAULT_MEMORY_LIMIT", 8000)                      # In MB, 0 means no limit
+
+# Parallel document loading configuration
+PDF_LOAD_WORKERS = _env_int("PDF_LOAD_WORKERS", 0)                                 # 0 means one per CPU core
+PDF_WORKER_MEMORY_MB = _env_int("PDF_WORKER_MEMORY_MB", 500)                       # Estimated peak memory per worker
+
+
+# System resources
+@functools.lru_cache(maxsize=1)
+def _total_memory_mb():
+    """
+    Returns total system memory in MB, or None if psutil is not available.
+    Cached, since total memory does not change while the process runs.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.virtual_memory().total / (1024 * 1024)
+
+
+def _faiss_simd_level():
+    """
+    Returns the SIMD instruction set FAISS uses for distance computations, e.g. "AVX2".
+    Useful to confirm the installed wheel isn't running generic kernels.
+    """
+    try:
+        import faiss
+    except ImportError:
+        return "Unknown (faiss not installed)"
+
+    # Dynamic-dispatch builds (faiss >= 1.8) pick the level at runtime
+    if hasattr(faiss, "SIMDConfig"):
+        return faiss.SIMDConfig.get_level_name()
+    return faiss.get_compile_options().strip() or "Generic"
+
+
+# Prompt rendering
+def _compile_prompt(template):
+    """
+    Parses a str.format-style template once into (literal, field name) pairs.
+
+    Only plain {context} and {question} placeholders are supported. Anything else (other
+    field names, conversions like {context!r}, format specs like {question:>10}, unbalanced
+    braces) is collected as a problem instead of raised, so a bad PROMPT_TEMPLATE doesn't
+    break importing the package; validate_system() reports it and render_prompt() refuses it.
+
+    Returns:
+        tuple: (parts, problems), where problems is a list of messages (empty if valid).
+    """
+    parts, problems = [], []
+    try:
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if field is None:
+                parts.append((literal, None))
+                continue
+            if field not in ("context", "question"):
+                problems.append(f"PROMPT_TEMPLATE contains unknown placeholder {{{field}}}")
+            elif conversion or spec:
+                problems.append(
+                    f"PROMPT_TEMPLATE placeholder {{{field}}} has a conversion or format spec, "
+                    f"which is not supported"
+                )
+            parts.append((literal, field))
+    except ValueError as e:
+        problems.append(f"PROMPT_TEMPLATE is not a valid template: {e}")
+    return parts, problems
+
+
+_PROMPT_PARTS, PROMPT_TEMPLATE_PROBLEMS = _compile_prompt(PROMPT_TEMPLATE)
+
+
+def render_prompt(context, question):
+    """
+    Fills PROMPT_TEMPLATE with the retrieved context and the user's question.
+    The template is parsed once at import, so rendering is a single join.
+
+    Raises:
+        ValueError: If PROMPT_TEMPLATE is invalid (see PROMPT_TEMPLATE_PROBLEMS).
+    """
+    if PROMPT_TEMPLATE_PROBLEMS:
+        raise ValueError("; ".join(PROMPT_TEMPLATE_PROBLEMS))
+    values = {"context": context, "question": question}
+    return "".join(
+        literal + (values[field] if field is not None else "")
+        for literal, field in _PROMPT_PARTS
+    )
 
 
 # Checking if the directories exist, if not, create them
+_dirs_ready = False
+
+
 def ensure_directories():
     """
     Ensures the necessary application directories exist, creates them if they don't.
+    Only the first call per process touches the filesystem.
     """
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    
     directories = [
         ("Data", DATA_PATH),
-        ("FAISS Index", FAISS_PATH)
+        ("FAISS Index", FAISS_PATH),
+        ("Cache", CACHE_PATH)
     ]
     
     for name, path in directories:
@@ -82,47 +237,68 @@ def ensure_directories():
             raise PermissionError(f"Permission denied: Cannot create {name} directory at {path}")
         except OSError as e:
             raise OSError(f"Failed to create {name} directory at {path}: {e}")
+    
+    _dirs_ready = True
 
 # Checking the OLLAMA models are set correctly
+def get_available_models():
+    """
+    Returns the set of model names installed on the Ollama server.
+    
+    Queries the server's /api/tags endpoint directly instead of spawning `ollama list`.
+    Models tagged ":latest" are also listed under their bare name, matching how
+    Ollama resolves untagged model names.
+    """
+    import json
+    import urllib.request
+    from urllib.error import URLError
+    
+    try:
+        with urllib.request.urlopen(f"{OLLAMA_BASE_URL.rstrip('/')}/api/tags", timeout=2) as response:
+            data = json.load(response)
+    except (URLError, OSError) as e:
+        raise EnvironmentError(f"Ollama server not reachable at {OLLAMA_BASE_URL}: {e}")
+    
+    names = set()
+    for model in data.get("models", []):
+        name = model["name"]
+        names.add(name)
+        if name.endswith(":latest"):
+            names.add(name[:-len(":latest")])
+    return names
+
+
 def check_ollama_models():
     """
     Checks if the user's system has ollama setup properly and the models installed.
-    If Ollama is not installed, it raises an error.
+    If the Ollama server is not reachable, it raises an error.
     If the models are missing, it asks the user to install or choose different models.
     """
-    import subprocess
+    available_models = get_available_models()
     
-    try:
-        # Check if ollama is installed and accessible
-        result = subprocess.run(["ollama", "list"], capture_output=True, text=True, check=True)
-        available_models = result.stdout
+    # Check if required models are available
+    query_model_available = OLLAMA_QUERY_MODEL in available_models
+    embedding_model_available = OLLAMA_EMBEDDING_MODEL in available_models
+    
+    if not query_model_available or not embedding_model_available:
+        print(f"Required Models are missing:")
+        if not query_model_available:
+            print(f"  - Query model '{OLLAMA_QUERY_MODEL}' not found")
+        if not embedding_model_available:
+            print(f"  - Embedding model '{OLLAMA_EMBEDDING_MODEL}' not found")
+        
+        print(f"\nAvailable models:")
+        for name in sorted(available_models):
+            print(f"  - {name}")
         
-        # Check if required models are available
-        query_model_available = OLLAMA_QUERY_MODEL in available_models
-        embedding_model_available = OLLAMA_EMBEDDING_MODEL in available_models
+        choice = input("Do you want to (1) install missing models or (2) choose different models? [1/2]: ").strip()
         
-        if not query_model_available or not embedding_model_available:
-            print(f"Required Models are missing:")
-            if not query_model_available:
-                print(f"  - Query model '{OLLAMA_QUERY_MODEL}' not found")
-            if not embedding_model_available:
-                print(f"  - Embedding model '{OLLAMA_EMBEDDING_MODEL}' not found")
-            
-            print(f"\nAvailable models:\n{available_models}")
-            
-            choice = input("Do you want to (1) install missing models or (2) choose different models? [1/2]: ").strip()
-            
-            if choice == "1":
-                install_missing_models(query_model_available, embedding_model_available)
-            elif choice == "2":
-                choose_alternative_models(available_models)
-            else:
-                raise ValueError("Invalid choice. Please run the configuration again.")
-                
-    except subprocess.CalledProcessError:
-        raise EnvironmentError("Ollama is not installed or not accessible. Please install Ollama to use this system.")
-    except FileNotFoundError:
-        raise EnvironmentError("Ollama command not found. Please ensure Ollama is installed and in your PATH.")
+        if choice == "1":
+            install_missing_models(query_model_available, embedding_model_available)
+        elif choice == "2":
+            choose_alternative_models(available_models)
+        else:
+            raise ValueError("Invalid choice. Please run the configuration again.")
 
 
 def install_missing_models(query_available, embedding_available):
@@ -168,9 +344,19 @@ def validate_config():
     elif CHUNK_SIZE > 2000:
         issues.append(f"CHUNK_SIZE ({CHUNK_SIZE}) is very large, consider using less than 2000")
     
+    if CHUNK_SPLITTER not in ("recursive", "recursive_token", "token"):
+        issues.append(f"CHUNK_SPLITTER ({CHUNK_SPLITTER}) must be 'recursive', 'recursive_token' or 'token'")
+    
     if CHUNK_OVERLAP >= CHUNK_SIZE:
         issues.append(f"CHUNK_OVERLAP ({CHUNK_OVERLAP}) should be smaller than CHUNK_SIZE ({CHUNK_SIZE})")
     
+    # Check embedding configuration
+    if EMBED_BATCH_SIZE < 1:
+        issues.append(f"EMBED_BATCH_SIZE ({EMBED_BATCH_SIZE}) must be at least 1")
+    
+    if EMBED_CONCURRENCY < 1:
+        issues.append(f"EMBED_CONCURRENCY ({EMBED_CONCURRENCY}) must be at least 1")
+    
     # Check query configuration
     if DEFAULT_K < 1:
         issues.append(f"DEFAULT_K ({DEFAULT_K}) must be at least 1")
@@ -183,22 +369,33 @@ def validate_config():
     if DEFAULT_MAX_CONTEXT_LENGTH < 1000:
         issues.append(f"DEFAULT_MAX_CONTEXT_LENGTH ({DEFAULT_MAX_CONTEXT_LENGTH}) is very small, consider at least 1000")
     
-    # Check memory limit
-    try:
-        import psutil
-        total_memory_mb = psutil.virtual_memory().total / (1024 * 1024)
-        if DEFAULT_MEMORY_LIMIT > total_memory_mb * 0.9:
-            issues.append(f"DEFAULT_MEMORY_LIMIT ({DEFAULT_MEMORY_LIMIT} MB) is too close to total memory ({total_memory_mb:.0f} MB)")
-    except ImportError:
-        pass  # Skip memory validation if psutil not available
+    if not (0.0 <= SEMANTIC_CACHE_THRESHOLD <= 1.0):
+        issues.append(f"SEMANTIC_CACHE_THRESHOLD ({SEMANTIC_CACHE_THRESHOLD}) should be between 0.0 and 1.0")
     
-    # Check if base directory is writable
-    try:
-        test_file = INQUIRO_BASE_DIR / "test_write.tmp"
-        test_file.touch()
-        test_file.unlink()
-    except (PermissionError, OSError) as e:
-        issues.append(f"Cannot write to base directory {INQUIRO_BASE_DIR}: {e}")
+    # Check FAISS index configuration
+    if FAISS_INDEX_TYPE not in ("flat", "ivfpq", "sq8", "sqfp16"):
+        issues.append(f"FAISS_INDEX_TYPE ({FAISS_INDEX_TYPE}) must be 'flat', 'ivfpq', 'sq8' or 'sqfp16'")
+    
+    if FAISS_GPU_MIN_VECTORS < 0:
+        issues.append(f"FAISS_GPU_MIN_VECTORS ({FAISS_GPU_MIN_VECTORS}) must be non-negative")
+    
+    if FAISS_NPROBE < 1:
+        issues.append(f"FAISS_NPROBE ({FAISS_NPROBE}) must be at least 1")
+    
+    # Check memory limit (skipped if psutil not available)
+    total_memory_mb = _total_memory_mb()
+    if total_memory_mb is not None and DEFAULT_MEMORY_LIMIT > total_memory_mb * 0.9:
+        issues.append(f"DEFAULT_MEMORY_LIMIT ({DEFAULT_MEMORY_LIMIT} MB) is too close to total memory ({total_memory_mb:.0f} MB)")
+    
+    # Check if base directory is writable. os.access is a single syscall; it can be
+    # pessimistic on network filesystems, so confirm a failure with a real write.
+    if not os.access(INQUIRO_BASE_DIR, os.W_OK):
+        try:
+            test_file = INQUIRO_BASE_DIR / "test_write.tmp"
+            test_file.touch()
+            test_file.unlink()
+        except (PermissionError, OSError) as e:
+            issues.append(f"Cannot write to base directory {INQUIRO_BASE_DIR}: {e}")
     
     # Warn about issues
     if issues:
@@ -215,13 +412,12 @@ def get_config_summary():
     Returns a summary of the current configuration.
     """
     # Try to get system memory info
-    try:
-        import psutil
-        total_memory_mb = psutil.virtual_memory().total / (1024 * 1024)
+    total_memory_mb = _total_memory_mb()
+    if total_memory_mb is not None:
         memory_info = f"{total_memory_mb:.0f} MB"
         recommended_limit = max(int(total_memory_mb * 0.7), 1000)
         memory_recommendation = f"(Recommended limit: {recommended_limit} MB)"
-    except ImportError:
+    else:
         memory_info = "Unknown (install psutil for memory monitoring)"
         memory_recommendation = ""
         
@@ -230,10 +426,13 @@ def get_config_summary():
    Base Directory: {INQUIRO_BASE_DIR}
    Data Path: {DATA_PATH}
    FAISS Path: {FAISS_PATH}
+   Cache Path: {CACHE_PATH}
    
    Models:
    Query Model: {OLLAMA_QUERY_MODEL}
    Embedding Model: {OLLAMA_EMBEDDING_MODEL}
+   Embedding Batch Size: {EMBED_BATCH_SIZE} ({EMBED_CONCURRENCY} concurrent requests)
+   Embedding Cache: {'Enabled' if EMBEDDING_CACHE else 'Disabled'}
    
    System Resources:
    Total Memory: {memory_info}
@@ -242,50 +441,74 @@ def get_config_summary():
    Text Processing:
    Chunk Size: {CHUNK_SIZE}
    Chunk Overlap: {CHUNK_OVERLAP}
+   Chunk Splitter: {CHUNK_SPLITTER}
+   
+   Vector Index:
+   Index Type: {"flat (exact search)" if FAISS_INDEX_TYPE == "flat" else f"{FAISS_INDEX_TYPE} (compressed above {IVF_THRESHOLD} vectors)"}
+   Probes per Query: {FAISS_NPROBE}
+   SIMD Level: {_faiss_simd_level()}
+   Memory-mapped: {"Yes" if FAISS_MMAP else "No"}
+   GPU Search: {f"Enabled{' (fp16)' if FAISS_GPU_FP16 else ''} above {FAISS_GPU_MIN_VECTORS} vectors" if FAISS_USE_GPU else "Disabled"}
    
    Query Settings:
    Default K (retrieved docs): {DEFAULT_K}
    Score Threshold: {DEFAULT_SCORE_THRESHOLD}
    Max Context Length: {DEFAULT_MAX_CONTEXT_LENGTH}
+   Semantic Cache: {f"Enabled (threshold {SEMANTIC_CACHE_THRESHOLD})" if SEMANTIC_CACHE else "Disabled"}
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _probe_embedding():
+    """
+    Embeds a short test string once per process.
+    Repeated validations reuse the result instead of making another round-trip to Ollama.
+    """
+    from inquiro.core.embedding import get_embedding
+    return bool(get_embedding().embed_query("test"))
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_query_model():
+    """
+    Instantiates the query model client once per process.
+    Doesn't actually invoke it to avoid unnecessary API calls.
+    """
+    try:
+        from langchain_ollama import OllamaLLM as Ollama
+    except ImportError:
+        from langchain_community.llms.ollama import Ollama
+    return Ollama(model=OLLAMA_QUERY_MODEL, base_url=OLLAMA_BASE_URL)
+
+
 def validate_system():
     """
     Validates that the system is properly configured and ready to use.
-    Checks FAISS index, embedding function, and Ollama model availability.
+    Checks the prompt template, FAISS index, embedding function, and Ollama model availability.
+    The embedding and model probes run once per process and are skipped if INQUIRO_SKIP_PROBE is set.
     
     Returns:
         bool: True if system is ready, False if there are issues
     """
-    issues = []
+    issues = list(PROMPT_TEMPLATE_PROBLEMS)
     
     # Check if FAISS index exists
-    if not os.path.exists(FAISS_PATH):
+    if not FAISS_PATH.exists():
         issues.append(f"FAISS index not found at {FAISS_PATH}")
     
-    # Check if embedding function works
-    try:
-        from inquiro.core.embedding import get_embedding
-        embedding_function = get_embedding()
-        test_embedding = embedding_function.embed_query("test")
-        if not test_embedding:
-            issues.append("Embedding function not working properly")
-                
-    except Exception as e:
-        issues.append(f"Embedding function error: {e}")
-    
-    # Check if Ollama model is accessible
-    try:
+    if not SKIP_PROBE:
+        # Check if embedding function works
         try:
-            from langchain_ollama import OllamaLLM as Ollama
-        except ImportError:
-            from langchain_community.llms.ollama import Ollama
+            if not _probe_embedding():
+                issues.append("Embedding function not working properly")
+        except Exception as e:
+            issues.append(f"Embedding function error: {e}")
         
-        model = Ollama(model=OLLAMA_QUERY_MODEL)
-        # Don't actually invoke to avoid unnecessary API calls
-    except Exception as e:
-        issues.append(f"Ollama model '{OLLAMA_QUERY_MODEL}' not accessible: {e}")
+        # Check if Ollama model is accessible
+        try:
+            _probe_query_model()
+        except Exception as e:
+            issues.append(f"Ollama model '{OLLAMA_QUERY_MODEL}' not accessible: {e}")
     
     if issues:
         print("❌ System validation failed:")
@@ -307,9 +530,8 @@ def configure_memory_limit():
     """
     global DEFAULT_MEMORY_LIMIT
     
-    try:
-        import psutil
-        total_memory_mb = psutil.virtual_memory().total / (1024 * 1024)
+    total_memory_mb = _total_memory_mb()
+    if total_memory_mb is not None:
         recommended_limit = max(int(total_memory_mb * 0.7), 1000)
         
         memory_choice = input(f"Set memory limit for database operations? [Y/n]: ").strip().lower()
@@ -326,7 +548,7 @@ def configure_memory_limit():
                 print(f"Invalid input. Using default memory limit: {DEFAULT_MEMORY_LIMIT}")
         else:
             print(f"✅ Using current memory limit: {'None' if DEFAULT_MEMORY_LIMIT <= 0 else f'{DEFAULT_MEMORY_LIMIT} MB'}")
-    except ImportError:
+    else:
         print("Warning: psutil not available, memory monitoring disabled")
         print("Run: pip install psutil to enable memory monitoring")
     
@@ -8,8 +8,10 @@ import argparse
 import os
 from pathlib import Path
 import shutil
-import glob
-from langchain_community.document_loaders import PyMuPDFLoader
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import pymupdf
 try:
     from langchain_community.document_loaders import UnstructuredWordDocumentLoader
     from langchain_community.document_loaders import UnstructuredFileLoader
@@ -17,14 +19,17 @@ except ImportError:
     # Fallback for older versions or missing unstructured dependency
     UnstructuredWordDocumentLoader = None
     UnstructuredFileLoader = None
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
-from langchain_community.vectorstores import FAISS
 
+from . import semantic_cache
 from .embedding import get_embedding
+from .splitting import get_text_splitter
+from .vectorstore import create_store, add_documents, embed_documents, load_store, compact_index, remove_sources
+from .vectorstore import chunk_ids, save_store
+from .manifest import load_manifest, save_manifest, file_entry
 from .config import DATA_PATH, FAISS_PATH
-from .config import CHUNK_SIZE, CHUNK_OVERLAP
 from .config import DEFAULT_MEMORY_LIMIT
+from .config import PDF_LOAD_WORKERS, PDF_WORKER_MEMORY_MB
 
 def main():
     """
@@ -83,6 +88,9 @@ def main():
         documents = load_documents()
         chunks = split_documents(documents)
         add_to_faiss(chunks)
+    
+    # Cached answers were generated from the previous document set
+    semantic_cache.clear()
 
 
 def determine_reset_behavior(reset_flag, no_reset_flag):
@@ -126,6 +134,109 @@ def prompt_user_for_reset():
             print("Invalid choice. Please enter 1, 2, r, or u.")
 
 
+def find_documents(stats=None):
+    """
+    Scans DATA_PATH once and groups the supported documents by type.
+    
+    Directory entries from os.scandir carry their file type, so subdirectories are
+    skipped without an extra stat call per file. Extensions are matched case-insensitively.
+    
+    Args:
+        stats: Optional dict that is filled with path -> os.stat_result for every document,
+            taken from the (cached) directory entry so callers don't stat each file again.
+    
+    Returns:
+        tuple: (pdf_files, docx_files, doc_files), each a sorted list of file paths
+    """
+    files_by_ext = {".pdf": [], ".docx": [], ".doc": []}
+    try:
+        with os.scandir(DATA_PATH) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in files_by_ext and entry.is_file():
+                    files_by_ext[ext].append(entry.path)
+                    if stats is not None:
+                        stats[entry.path] = entry.stat()
+    except FileNotFoundError:
+        pass
+    
+    return tuple(sorted(files_by_ext[ext]) for ext in (".pdf", ".docx", ".doc"))
+
+
+# Loaded PDFs buffered per worker process ahead of the consumer
+_PDF_PREFETCH_PER_WORKER = 2
+
+
+def _load_one_pdf(pdf_file):
+    """
+    Loads a single PDF, one Document per page. Defined at module level so it can be pickled
+    into worker processes.
+    
+    Pages are read with PyMuPDF directly rather than through PyMuPDFLoader, which serializes
+    parsing behind a global lock and copies the whole PDF metadata dictionary into every page.
+    Each page only carries the "source" and "page" metadata that chunk IDs are built from.
+    
+    Returns:
+        tuple: (pdf_file, pages, error) where error is None on success
+    """
+    try:
+        with pymupdf.open(pdf_file) as pdf:
+            pages = [
+                Document(page_content=page.get_text(), metadata={"source": pdf_file, "page": page.number})
+                for page in pdf
+            ]
+        return pdf_file, pages, None
+    except Exception as e:
+        return pdf_file, [], str(e)
+
+
+def _pdf_worker_count(num_files, memory_limit=DEFAULT_MEMORY_LIMIT):
+    """
+    Number of worker processes to use for PDF loading.
+    Bounded by CPU count, the number of files, and the memory limit (if any).
+    """
+    workers = PDF_LOAD_WORKERS if PDF_LOAD_WORKERS > 0 else (os.cpu_count() or 1)
+    if memory_limit > 0:
+        workers = min(workers, max(1, memory_limit // PDF_WORKER_MEMORY_MB))
+    return max(1, min(workers, num_files))
+
+
+def load_pdfs(pdf_files, memory_limit=DEFAULT_MEMORY_LIMIT):
+    """
+    Loads PDFs with a process pool, since PyMuPDF text extraction is CPU-bound per file.
+    Falls back to loading sequentially for a single file or worker, or if the pool fails.
+    
+    Only a few files per worker are loaded ahead of the consumer, so a slow consumer
+    (e.g. embedding each batch) doesn't cause every parsed PDF to pile up in memory.
+    
+    Yields:
+        tuple: (pdf_file, pages, error) in the order of pdf_files
+    """
+    done = 0
+    workers = _pdf_worker_count(len(pdf_files), memory_limit)
+    if workers > 1:
+        print(f"Loading {len(pdf_files)} PDFs with {workers} worker processes...")
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for pdf_file in pdf_files:
+                    pending.append(executor.submit(_load_one_pdf, pdf_file))
+                    if len(pending) >= workers * _PDF_PREFETCH_PER_WORKER:
+                        yield pending.popleft().result()
+                        done += 1
+                while pending:
+                    yield pending.popleft().result()
+                    done += 1
+            return
+        except (BrokenProcessPool, OSError) as e:
+            print(f"Warning: Parallel PDF loading failed ({e}), loading sequentially")
+    
+    for pdf_file in pdf_files[done:]:
+        yield _load_one_pdf(pdf_file)
+
+
 def load_documents():
     """
     Loads all PDF, DOCX, and DOC files from the data directory specified by DATA_PATH.
@@ -133,22 +244,19 @@ def load_documents():
     Returns a list of Document objects (pages/sections)
     """
     documents = []
-    pdf_files = glob.glob(os.path.join(DATA_PATH, "*.pdf"))
-    docx_files = glob.glob(os.path.join(DATA_PATH, "*.docx"))
-    doc_files = glob.glob(os.path.join(DATA_PATH, "*.doc"))
+    pdf_files, docx_files, doc_files = find_documents()
     
     if not pdf_files and not docx_files and not doc_files:
         print(f"No PDF, DOCX, or DOC files found in {DATA_PATH} directory.")
         return documents
     
-    # Load PDF files
-    for pdf_file in pdf_files:
-        print(f"Loading PDF: {pdf_file}...")
-        try:
-            loader = PyMuPDFLoader(pdf_file)
-            documents.extend(loader.load())
-        except Exception as e:
-            print(f"Error loading PDF {pdf_file}: {e}")
+    # Load PDF files (in parallel when there are several)
+    for pdf_file, pages, error in load_pdfs(pdf_files):
+        if error is not None:
+            print(f"Error loading PDF {pdf_file}: {error}")
+        else:
+            print(f"Loaded PDF: {pdf_file} ({len(pages)} pages)")
+            documents.extend(pages)
     
     # Check if Unstructured loaders are available
     if UnstructuredWordDocumentLoader is None or UnstructuredFileLoader is None:
@@ -182,14 +290,9 @@ def load_documents():
 
 def split_documents(documents: list[Document], batch=False):
     """
-    Splits a list of Document objects into smaller text chunks using RecursiveCharacterTextSplitter.
+    Splits a list of Document objects into smaller text chunks using the splitter selected by CHUNK_SPLITTER.
     """
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=CHUNK_SIZE,
-        chunk_overlap=CHUNK_OVERLAP,
-        length_function=len,
-        is_separator_regex=False,
-    )
+    text_splitter = get_text_splitter()
     
     if batch and documents:
         # Process one document at a time to save memory
@@ -212,6 +315,8 @@ def add_to_faiss(chunks: list[Document], batch_size=None):
     Adds a list of chunked Document objects to the FAISS vector store.
     Loads an existing FAISS index if present, or creates a new one.
     Embeddings are generated using the embedding function from get_embedding().
+    Chunks already in the index are skipped, except those of source files that changed since
+    they were indexed, which are replaced (see drop_changed_sources()).
     """
     if not chunks:
         print("No chunks to add to database.")
@@ -222,19 +327,15 @@ def add_to_faiss(chunks: list[Document], batch_size=None):
         print(f"Using batch processing with batch size {batch_size}...")
         
         embedding_function = get_embedding()
-        db = None
-        
-        # Load existing database if it exists
-        if os.path.exists(FAISS_PATH):
-            print("Loading existing FAISS index...")
-            try:
-                db = FAISS.load_local(str(FAISS_PATH), embedding_function, allow_dangerous_deserialization=True)
-            except Exception as e:
-                print(f"Error loading existing index: {e}")
-                print("Will create a new FAISS index...")
+        db = load_existing_store(embedding_function)
+        manifest, removed = drop_changed_sources(db, chunks)
                 
         # Calculate IDs for all chunks
-        chunks_with_ids = calculate_chunk_ids(chunks)
+        chunks_with_ids = new_chunks(db, calculate_chunk_ids(chunks))
+        if not chunks_with_ids and not removed:
+            save_manifest(manifest)
+            print("✅ All chunks are already in the database.")
+            return
         total_chunks = len(chunks_with_ids)
         
         # Process in batches
@@ -248,38 +349,68 @@ def add_to_faiss(chunks: list[Document], batch_size=None):
         
         # Save the final database
         if db:
-            db.save_local(str(FAISS_PATH))
+            compact_index(db)
+            save_store(db)
+            save_manifest(manifest)
             print(f"✅ Saved FAISS index with {total_chunks} chunks.")
         
     else:
         # Traditional processing (all at once - original behavior)
         chunks_with_ids = calculate_chunk_ids(chunks)
         embedding_function = get_embedding()
+        db = load_existing_store(embedding_function)
+        manifest, removed = drop_changed_sources(db, chunks_with_ids)
+
+        chunks_with_ids = new_chunks(db, chunks_with_ids)
+        if not chunks_with_ids and not removed:
+            save_manifest(manifest)
+            print("✅ All chunks are already in the database.")
+            return
 
-        if os.path.exists(FAISS_PATH):
-            print("Loading existing FAISS index...")
+        # Embed once, whether the chunks end up in the loaded index or a new one
+        vectors = embed_documents(chunks_with_ids, embedding_function) if chunks_with_ids else None
+
+        if chunks_with_ids and db is not None:
+            print("Adding new documents to existing index...")
             try:
-                db = FAISS.load_local(str(FAISS_PATH), embedding_function, allow_dangerous_deserialization=True)
-                
-                print("Adding new documents to existing index...")
-                
-                new_db = FAISS.from_documents(chunks_with_ids, embedding_function)
-                
-                db.merge_from(new_db)
-                
+                add_documents(db, chunks_with_ids, vectors)
             except Exception as e:
-                print(f"Error loading existing index: {e}")
-                print("Creating new FAISS index...")
-                db = FAISS.from_documents(chunks_with_ids, embedding_function)
-        else:
+                # chunks_with_ids only holds the new chunks, so a store built from them must
+                # never replace the existing index
+                print(f"❌ Error adding to existing index: {e}")
+                print("💡 The existing index was left unchanged. Try again with --reset to rebuild it.")
+                return
+        elif db is None:
             print("Creating new FAISS index...")
-            db = FAISS.from_documents(chunks_with_ids, embedding_function)
+            db = create_store(chunks_with_ids, embedding_function, vectors)
 
         # Save the index
-        db.save_local(str(FAISS_PATH))
+        compact_index(db)
+        save_store(db)
+        save_manifest(manifest)
         print(f"✅ Saved FAISS index with {len(chunks_with_ids)} chunks.")
 
 
+def load_existing_store(embedding_function):
+    """
+    Loads the FAISS index at FAISS_PATH for updating.
+    
+    Returns:
+        The vector store, or None if there is no index yet or it can't be loaded
+        (in which case a new one should be created).
+    """
+    if not os.path.exists(FAISS_PATH):
+        return None
+    
+    print("Loading existing FAISS index...")
+    try:
+        return load_store(embedding_function)
+    except Exception as e:
+        print(f"Error loading existing index: {e}")
+        print("Will create a new FAISS index...")
+        return None
+
+
 def calculate_chunk_ids(chunks):
     """
     Assigns a unique ID to each chunk based on its source file and page number.
@@ -287,25 +418,74 @@ def calculate_chunk_ids(chunks):
     Modifies the metadata of each chunk in-place.
     Returns the list of chunks with updated IDs.
     """
-    last_page_id = None
-    current_chunk_index = 0
-
+    # Chunks of the same page are numbered 0, 1, 2, ... in order, even if other pages'
+    # chunks come in between
+    next_index = defaultdict(int)
     for chunk in chunks:
-        source = chunk.metadata.get("source")
-        page = chunk.metadata.get("page")
-        current_page_id = f"{source}:{page}"
+        metadata = chunk.metadata
+        page_id = f"{metadata.get('source')}:{metadata.get('page')}"
+        metadata["id"] = f"{page_id}:{next_index[page_id]}"
+        next_index[page_id] += 1
 
-        if current_page_id == last_page_id:
-            current_chunk_index += 1
-        else:
-            current_chunk_index = 0
+    return chunks
 
-        chunk_id = f"{current_page_id}:{current_chunk_index}"
-        last_page_id = current_page_id
 
-        chunk.metadata["id"] = chunk_id
+def drop_changed_sources(db, chunks):
+    """
+    Removes the chunks of source files that changed since they were indexed, so new_chunks()
+    re-embeds them instead of keeping their stale content under unchanged chunk IDs.
+    
+    Changes are detected with the ingest manifest, as in process_documents_in_batches(). A
+    source that has chunks in the database but no manifest entry can't be checked, so it is
+    re-indexed as well.
+    
+    Args:
+        db: Existing FAISS database or None
+        chunks: List of Document chunks with "source" metadata
+        
+    Returns:
+        tuple: (manifest, removed) - the manifest to save together with the index, and the
+        number of chunks removed from the database
+    """
+    previous_manifest = load_manifest() if db is not None else {}
+    manifest = dict(previous_manifest)
+    changed_files = []
+    for path in dict.fromkeys(chunk.metadata.get("source") for chunk in chunks):
+        if not path or not os.path.isfile(path):
+            continue
+        entry = file_entry(path, previous_manifest.get(path))
+        if previous_manifest.get(path, {}).get("digest") != entry["digest"]:
+            changed_files.append(path)
+        manifest[path] = entry
+    
+    removed = remove_sources(db, changed_files) if db is not None and changed_files else 0
+    if removed:
+        print(f"Removed {removed} existing chunks of changed files.")
+    return manifest, removed
 
-    return chunks
+
+def new_chunks(db, chunks):
+    """
+    Drops the chunks whose IDs (see calculate_chunk_ids) are already in the database,
+    so re-running an update only embeds what is new.
+    
+    Args:
+        db: Existing FAISS database or None
+        chunks: List of Document chunks with IDs
+        
+    Returns:
+        The chunks that are not in the database yet
+    """
+    if db is None:
+        return chunks
+    existing_ids = chunk_ids(db)
+    if not existing_ids:
+        return chunks
+    
+    fresh = [chunk for chunk in chunks if chunk.metadata["id"] not in existing_ids]
+    if len(fresh) < len(chunks):
+        print(f"Skipping {len(chunks) - len(fresh)} chunks already in the database.")
+    return fresh
 
 
 def clear_database():
@@ -316,6 +496,7 @@ def clear_database():
     if os.path.exists(FAISS_PATH):
         shutil.rmtree(FAISS_PATH)
         print("Database cleared.")
+    semantic_cache.clear()
 
 
 def process_documents_in_batches(batch_size=1000, memory_limit=0):
@@ -345,9 +526,8 @@ def process_documents_in_batches(batch_size=1000, memory_limit=0):
         return False
     
     # Get all file paths first
-    pdf_files = glob.glob(os.path.join(DATA_PATH, "*.pdf"))
-    docx_files = glob.glob(os.path.join(DATA_PATH, "*.docx"))
-    doc_files = glob.glob(os.path.join(DATA_PATH, "*.doc"))
+    file_stats = {}
+    pdf_files, docx_files, doc_files = find_documents(file_stats)
     
     if not pdf_files and not docx_files and not doc_files:
         print(f"No PDF, DOCX, or DOC files found in {DATA_PATH} directory.")
@@ -355,50 +535,70 @@ def process_documents_in_batches(batch_size=1000, memory_limit=0):
     
     # Initialize embedding function and text splitter
     embedding_function = get_embedding()
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=CHUNK_SIZE,
-        chunk_overlap=CHUNK_OVERLAP,
-        length_function=len,
-        is_separator_regex=False,
-    )
+    text_splitter = get_text_splitter()
     
     # Initialize database (will be None if not exists yet)
-    db = None
-    if os.path.exists(FAISS_PATH):
-        print("Loading existing FAISS index...")
-        try:
-            db = FAISS.load_local(str(FAISS_PATH), embedding_function, allow_dangerous_deserialization=True)
-        except Exception as e:
-            print(f"Error loading existing index: {e}")
-            print("Will create a new FAISS index...")
-            db = None
+    db = load_existing_store(embedding_function)
+    
+    # Skip files that haven't changed since they were last ingested into this database
+    previous_manifest = load_manifest() if db is not None else {}
+    manifest = {}
+    pending_entries = {}
+    changed_files = []
+    for path in pdf_files + docx_files + doc_files:
+        entry = file_entry(path, previous_manifest.get(path), file_stats[path])
+        if previous_manifest.get(path, {}).get("digest") == entry["digest"]:
+            manifest[path] = entry
+        else:
+            pending_entries[path] = entry
+            # Without a manifest, any file may already have chunks in the database
+            if db is not None and (path in previous_manifest or not previous_manifest):
+                changed_files.append(path)
+    
+    skipped = len(manifest)
+    if skipped:
+        print(f"Skipping {skipped} unchanged files.")
+        pdf_files, docx_files, doc_files = (
+            [f for f in files if f in pending_entries] for files in (pdf_files, docx_files, doc_files)
+        )
+    
+    # Chunks of modified files are replaced rather than added a second time
+    if db is not None and changed_files:
+        removed = remove_sources(db, changed_files)
+        if removed:
+            print(f"Removed {removed} existing chunks of files being re-processed.")
     
     # Track total processed chunks
     total_chunks_processed = 0
     current_batch_chunks = []
     
-    # Process PDF files
-    for i, pdf_file in enumerate(pdf_files):
+    def add_file(path, pages):
+        """
+        Splits one loaded file and adds its chunks to the current batch. The batch is embedded
+        and added to the index as soon as it is full or memory runs high, so only one file's
+        pages and at most one batch of chunks are held at a time.
+        """
+        nonlocal db, total_chunks_processed, current_batch_chunks
+        
+        # Split into chunks and assign IDs
+        chunks = text_splitter.split_documents(pages)
+        current_batch_chunks.extend(calculate_chunk_ids(chunks))
+        manifest[path] = pending_entries[path]
+        
+        # If batch size reached or memory limit exceeded, process batch
+        if len(current_batch_chunks) >= batch_size or check_memory():
+            db = process_batch(current_batch_chunks, embedding_function, db)
+            total_chunks_processed += len(current_batch_chunks)
+            print(f"✅ Processed {total_chunks_processed} chunks so far...")
+            current_batch_chunks = []  # Clear batch
+    
+    # Process PDF files (parsed in parallel, chunked and embedded in order)
+    for i, (pdf_file, pages, error) in enumerate(load_pdfs(pdf_files, memory_limit)):
         print(f"Processing PDF [{i+1}/{len(pdf_files)}]: {pdf_file}...")
         try:
-            # Load a single document
-            loader = PyMuPDFLoader(pdf_file)
-            doc_chunks = loader.load()
-            
-            # Split into chunks and assign IDs
-            chunks = text_splitter.split_documents(doc_chunks)
-            chunks_with_ids = calculate_chunk_ids(chunks)
-            
-            # Add to current batch
-            current_batch_chunks.extend(chunks_with_ids)
-            
-            # If batch size reached or memory limit exceeded, process batch
-            if len(current_batch_chunks) >= batch_size or check_memory():
-                db = process_batch(current_batch_chunks, embedding_function, db)
-                total_chunks_processed += len(current_batch_chunks)
-                print(f"✅ Processed {total_chunks_processed} chunks so far...")
-                current_batch_chunks = []  # Clear batch
-                
+            if error:
+                raise RuntimeError(error)
+            add_file(pdf_file, pages)
         except Exception as e:
             print(f"Error processing PDF {pdf_file}: {e}")
     
@@ -407,24 +607,7 @@ def process_documents_in_batches(batch_size=1000, memory_limit=0):
         for i, docx_file in enumerate(docx_files):
             print(f"Processing DOCX [{i+1}/{len(docx_files)}]: {docx_file}...")
             try:
-                # Load a single document
-                loader = UnstructuredWordDocumentLoader(docx_file)
-                doc_chunks = loader.load()
-                
-                # Split into chunks and assign IDs
-                chunks = text_splitter.split_documents(doc_chunks)
-                chunks_with_ids = calculate_chunk_ids(chunks)
-                
-                # Add to current batch
-                current_batch_chunks.extend(chunks_with_ids)
-                
-                # If batch size reached, process batch
-                if len(current_batch_chunks) >= batch_size:
-                    db = process_batch(current_batch_chunks, embedding_function, db)
-                    total_chunks_processed += len(current_batch_chunks)
-                    print(f"✅ Processed {total_chunks_processed} chunks so far...")
-                    current_batch_chunks = []  # Clear batch
-                    
+                add_file(docx_file, UnstructuredWordDocumentLoader(docx_file).load())
             except Exception as e:
                 print(f"Error processing DOCX {docx_file}: {e}")
     elif docx_files:
@@ -436,24 +619,7 @@ def process_documents_in_batches(batch_size=1000, memory_limit=0):
         for i, doc_file in enumerate(doc_files):
             print(f"Processing DOC [{i+1}/{len(doc_files)}]: {doc_file}...")
             try:
-                # Load a single document
-                loader = UnstructuredFileLoader(doc_file)
-                doc_chunks = loader.load()
-                
-                # Split into chunks and assign IDs
-                chunks = text_splitter.split_documents(doc_chunks)
-                chunks_with_ids = calculate_chunk_ids(chunks)
-                
-                # Add to current batch
-                current_batch_chunks.extend(chunks_with_ids)
-                
-                # If batch size reached, process batch
-                if len(current_batch_chunks) >= batch_size:
-                    db = process_batch(current_batch_chunks, embedding_function, db)
-                    total_chunks_processed += len(current_batch_chunks)
-                    print(f"✅ Processed {total_chunks_processed} chunks so far...")
-                    current_batch_chunks = []  # Clear batch
-                    
+                add_file(doc_file, UnstructuredFileLoader(doc_file).load())
             except Exception as e:
                 print(f"Error processing DOC {doc_file}: {e}")
     elif doc_files:
@@ -466,16 +632,20 @@ def process_documents_in_batches(batch_size=1000, memory_limit=0):
         total_chunks_processed += len(current_batch_chunks)
     
     # Save the final database
-    if db:
-        db.save_local(str(FAISS_PATH))
-        print(f"✅ Database saved with {total_chunks_processed} total chunks.")
+    if db and (total_chunks_processed or changed_files):
+        compact_index(db)
+        save_store(db)
+        save_manifest(manifest)
+        print(f"✅ Database saved with {total_chunks_processed} new chunks.")
+    elif skipped:
+        print("All documents are up to date. Database not updated.")
     else:
         print("No chunks were processed. Database not updated.")
 
 
 def process_batch(chunks, embedding_function, existing_db):
     """
-    Process a batch of chunks and merge with existing database.
+    Process a batch of chunks and add them to the existing database.
     
     Args:
         chunks: List of Document chunks to process
@@ -499,17 +669,13 @@ def process_batch(chunks, embedding_function, existing_db):
     
     print(f"Generating embeddings for {len(chunks)} chunks...")
     
-    # Create new database from current batch
-    new_db = FAISS.from_documents(chunks, embedding_function)
-    
-    # If we have an existing database, merge with it
+    # If we have an existing database, add the batch to its index directly
     if existing_db is not None:
-        print("Merging with existing database...")
-        existing_db.merge_from(new_db)
+        add_documents(existing_db, chunks)
         return existing_db
     else:
         # Otherwise, this batch becomes our database
-        return new_db
+        return create_store(chunks, embedding_function)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
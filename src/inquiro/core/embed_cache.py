@@ -0,0 +1,114 @@
+"""
+Content-addressed on-disk cache for embeddings.
+
+Embedding a chunk is a pure function of (model, text), so vectors are stored in SQLite keyed by a
+hash of both. Re-indexing a corpus after small edits, or repeating a query, only sends the texts
+that were never embedded before to the model.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from .config import EMBEDDING_CACHE_PATH
+
+# SQLite limits the number of bound parameters per statement
+_SQLITE_MAX_PARAMS = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Wraps an embedding model with a persistent SQLite cache keyed by content hash.
+
+    Each text is hashed with BLAKE2b (together with the model name, so switching models
+    never serves stale vectors). Only cache misses are sent to the underlying model;
+    vectors are stored as raw float32 bytes.
+    """
+
+    def __init__(self, underlying: Embeddings, model_name: str, cache_path: Path = EMBEDDING_CACHE_PATH):
+        self.underlying = underlying
+        self.model_name = model_name
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _key(self, text: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def _get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Fetch cached vectors for the given keys in as few queries as possible."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                batch = keys[start:start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def _put_many(self, vectors: Dict[bytes, np.ndarray]) -> None:
+        """Store new vectors in a single write transaction."""
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()],
+                )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents_array(texts).tolist()
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Embeds texts into a single (N, d) float32 array, filled straight from the cache."""
+        keys = [self._key(text) for text in texts]
+        vectors = self._get_many(list(set(keys)))
+
+        # Deduplicate misses so repeated chunks are only embedded once
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in misses:
+                misses[key] = text
+
+        if misses:
+            miss_texts = list(misses.values())
+            if hasattr(self.underlying, "embed_documents_array"):
+                computed = self.underlying.embed_documents_array(miss_texts)
+            else:
+                computed = np.asarray(self.underlying.embed_documents(miss_texts), dtype=np.float32)
+            new_vectors = dict(zip(misses, computed))
+            self._put_many(new_vectors)
+            vectors.update(new_vectors)
+
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        result = np.empty((len(keys), len(vectors[keys[0]])), dtype=np.float32)
+        for row, key in enumerate(keys):
+            result[row] = vectors[key]
+        return result
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        cached = self._get_many([key])
+        if key in cached:
+            return cached[key].tolist()
+
+        vector = np.asarray(self.underlying.embed_query(text), dtype=np.float32)
+        self._put_many({key: vector})
+        return vector.tolist()
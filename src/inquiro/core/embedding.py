@@ -1,20 +1,108 @@
 """
 Provides a factory for creating a configured OllamaEmbeddings instance using the model from core.config.
 
+Embeddings are optionally memoized on disk (see embed_cache.CachedEmbeddings), so re-indexing a
+corpus only sends new or changed chunks to Ollama.
+
 Note: GPU acceleration for OLLAMA is configured at the Ollama server level, not handled by inquiro.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
 from langchain_ollama import OllamaEmbeddings
-from .config import OLLAMA_EMBEDDING_MODEL
+from .config import OLLAMA_BASE_URL, OLLAMA_EMBEDDING_MODEL, EMBED_BATCH_SIZE, EMBED_CONCURRENCY
+from .config import EMBEDDING_CACHE
+from .embed_cache import CachedEmbeddings
+
+# Embedding clients by model name, see get_embedding()
+_clients: Dict[str, Embeddings] = {}
+_clients_lock = threading.Lock()
 
 
-def get_embedding():
+class BatchedOllamaEmbeddings(OllamaEmbeddings):
     """
-    Returns a embedding model based on the configurations
+    OllamaEmbeddings that sends documents to the server in fixed-size batches.
+
+    A full ingest is embedded with one request per `batch_size` texts instead of
+    one giant request (or one request per chunk), which keeps request payloads
+    bounded while still amortizing the HTTP round-trip over many chunks. Up to
+    `concurrency` batches are in flight at once, so the server is never idle
+    waiting for the next request.
     """
-    try:
-        embeddings = OllamaEmbeddings(model=OLLAMA_EMBEDDING_MODEL)
+
+    batch_size: int = EMBED_BATCH_SIZE
+    concurrency: int = EMBED_CONCURRENCY
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return OllamaEmbeddings.embed_documents(self, texts)
+
+    def _embed_batches(self, texts: List[str]):
+        """Yields the embeddings of consecutive batches of texts, in order."""
+        batches = [texts[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+        workers = min(self.concurrency, len(batches))
+        if workers <= 1:
+            yield from map(self._embed_batch, batches)
+        else:
+            # Requests spend most of their time waiting on the socket, so threads overlap well.
+            # map() preserves batch order.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(self._embed_batch, batches)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        embeddings = []
+        for batch in self._embed_batches(texts):
+            embeddings.extend(batch)
+        return embeddings
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Like embed_documents(), but packs the vectors into one (N, d) float32 array.
+
+        The array is allocated once the first batch reveals the dimension, and each batch
+        is copied into its rows as it arrives, so the full result never exists as a list
+        of Python floats.
+        """
+        vectors = None
+        offset = 0
+        for batch in self._embed_batches(texts):
+            batch = np.asarray(batch, dtype=np.float32)
+            if vectors is None:
+                vectors = np.empty((len(texts), batch.shape[1]), dtype=np.float32)
+            vectors[offset:offset + len(batch)] = batch
+            offset += len(batch)
+        return vectors if vectors is not None else np.empty((0, 0), dtype=np.float32)
+
+
+def get_embedding(model: str = OLLAMA_EMBEDDING_MODEL):
+    """
+    Returns a embedding model based on the configurations.
+    
+    The instance is a per-model singleton, so every caller shares one Ollama HTTP
+    client (and its keep-alive connections) and one cache connection. Creation is
+    guarded by a lock, since the TUI calls this from worker threads.
+    """
+    embeddings = _clients.get(model)
+    if embeddings is not None:
+        return embeddings
+
+    with _clients_lock:
+        if model in _clients:
+            return _clients[model]
+        try:
+            embeddings = BatchedOllamaEmbeddings(
+                model=model,
+                base_url=OLLAMA_BASE_URL,
+                batch_size=EMBED_BATCH_SIZE,
+                concurrency=EMBED_CONCURRENCY
+            )
+            if EMBEDDING_CACHE:
+                embeddings = CachedEmbeddings(embeddings, model)
+        except Exception as e:
+            print(f"Error initializing embeddings: {e}")
+            raise
+        _clients[model] = embeddings
         return embeddings
-    except Exception as e:
-        print(f"Error initializing embeddings: {e}")
-        raise
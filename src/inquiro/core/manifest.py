@@ -0,0 +1,71 @@
+"""
+Manifest of the files that have been ingested into the vector database.
+
+For every ingested file the manifest records its modification time, size and a BLAKE2b digest
+of its contents. Incremental updates compare against it to skip files that haven't changed
+since they were last embedded. The manifest is stored inside FAISS_PATH, so it is removed
+together with the database on reset.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from .config import FAISS_PATH
+
+MANIFEST_PATH = FAISS_PATH / "manifest.json"
+
+# Read files in 1 MB blocks when hashing
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def load_manifest() -> Dict[str, dict]:
+    """
+    Returns the manifest as a dict of file path -> entry, or an empty dict if there is none.
+    """
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read ingest manifest ({e}), all files will be re-processed")
+        return {}
+
+
+def save_manifest(manifest: Dict[str, dict]) -> None:
+    """Write the manifest next to the saved index."""
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+
+
+def clear_manifest() -> None:
+    """Forget all ingested files, so the next update re-processes everything."""
+    if MANIFEST_PATH.exists():
+        MANIFEST_PATH.unlink()
+
+
+def file_digest(path: str) -> str:
+    """BLAKE2b digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_entry(path: str, previous: Optional[dict] = None, stat: Optional[os.stat_result] = None) -> dict:
+    """
+    Build the manifest entry for a file.
+
+    The file is only hashed if its size or modification time differ from the previous entry;
+    otherwise the previous digest is reused. Pass `stat` if it is already known (e.g. from
+    os.scandir) to avoid another stat call.
+    """
+    if stat is None:
+        stat = os.stat(path)
+    if previous and previous.get("mtime_ns") == stat.st_mtime_ns and previous.get("size") == stat.st_size:
+        return previous
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": file_digest(path)}
@@ -4,25 +4,37 @@ It retrieves relevant document chunks, constructs a prompt with the context, and
 """
 
 import argparse
-from langchain_community.vectorstores import FAISS
-from langchain_core.prompts import ChatPromptTemplate
+import functools
+import threading
+from typing import List
+
+import numpy as np
 try:
     from langchain_ollama import OllamaLLM as Ollama
 except ImportError:
     
     from langchain_community.llms.ollama import Ollama
 
+from . import semantic_cache
 from .embedding import get_embedding
+from .vectorstore import load_store
 from .config import (
-    FAISS_PATH, 
+    OLLAMA_BASE_URL,
     OLLAMA_QUERY_MODEL, 
-    FAISS_ALLOW_DANGEROUS_DESERIALIZATION,
+    FAISS_PATH,
+    FAISS_MMAP,
+    FAISS_USE_GPU,
     DEFAULT_K,
     DEFAULT_SCORE_THRESHOLD,
     DEFAULT_MAX_CONTEXT_LENGTH,
-    PROMPT_TEMPLATE
+    render_prompt,
+    SEMANTIC_CACHE
 )
 
+# Most recently loaded vector store, keyed by the modification times of its files
+_store_lock = threading.Lock()
+_store_cache = {}
+
 
 def main():
     """
@@ -50,7 +62,7 @@ def main():
 
 
 def query_rag(query_text: str, k: int = DEFAULT_K, threshold: float = DEFAULT_SCORE_THRESHOLD, 
-              verbose: bool = False, stream: bool = False):
+              verbose: bool = False, stream: bool = False, quiet: bool = False):
     """
     Query the RAG system using the provided text.
 
@@ -59,7 +71,8 @@ def query_rag(query_text: str, k: int = DEFAULT_K, threshold: float = DEFAULT_SC
         k: Number of documents to retrieve.
         threshold: Minimum similarity score.
         verbose: Whether to print detailed info.
-        stream: Whether to stream the response (not fully implemented).
+        stream: Whether to print the answer token by token as it is generated.
+        quiet: Don't print the answer and sources, for callers that display the result themselves.
 
     Returns:
         dict: A dictionary containing the answer, sources, and metadata, or None if failed.
@@ -76,14 +89,124 @@ def query_rag(query_text: str, k: int = DEFAULT_K, threshold: float = DEFAULT_SC
         print("❌ Error: Query cannot be empty")
         return None
     
+    # Serve semantically similar questions from the answer cache
+    cached = None
+    if SEMANTIC_CACHE:
+        # Taken before retrieval, so an answer from an index replaced meanwhile is stored as stale
+        scope = _cache_scope(k, threshold)
+        try:
+            cached = semantic_cache.lookup(query_text, scope)
+        except Exception as e:
+            if verbose:
+                print(f"⚠️  Semantic cache lookup failed: {e}")
+
+    if cached is not None:
+        if verbose:
+            print(f"⚡ Answer served from semantic cache (matched: {cached['question']})")
+        response_text, sources = cached["answer"], cached["sources"]
+    else:
+        result = _run_pipeline(query_text, k, threshold, verbose, stream)
+        if result is None:
+            return None
+        response_text, sources = result
+        if SEMANTIC_CACHE:
+            try:
+                semantic_cache.store(query_text, response_text, sources, scope)
+            except Exception as e:
+                if verbose:
+                    print(f"⚠️  Could not cache answer: {e}")
+
+    # Prepare response data
+    response_time = time.time() - start_time
+    
+    response_data = {
+        "answer": response_text,
+        "sources": sources,
+        "num_sources": len(sources),
+        "response_time": response_time,
+        "query": query_text,
+        "cached": cached is not None
+    }
+    
+    if quiet:
+        return response_data
+
+    # Format and display response (a streamed answer has already been printed)
+    if not (stream and cached is None):
+        _print_answer_header()
+        print(response_text)
+    print("\n" + "-"*30)
+    print(f"📚 Sources ({len(sources)}):")
+    for i, source in enumerate(sources, 1):
+        print(f"   {i}. {source}")
+    
+    if verbose:
+        print(f"⏱️  Response time: {response_time:.2f}s")
+        print("="*50)
+    
+    return response_data
+
+
+def _cache_scope(k: int, threshold: float) -> dict:
+    """
+    What an answer depends on besides the question, for the semantic cache: the query model,
+    the retrieval parameters and the version (modification time) of the vector index.
+    """
+    try:
+        index_version = (FAISS_PATH / "index.faiss").stat().st_mtime_ns
+    except OSError:
+        index_version = None
+    return {"model": OLLAMA_QUERY_MODEL, "k": k, "threshold": threshold, "index": index_version}
+
+
+def _print_answer_header():
+    print("\n" + "="*50)
+    print("🤖 Answer:")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_llm(model_name: str = OLLAMA_QUERY_MODEL):
+    """
+    Returns a shared Ollama client for the given model, so repeated queries reuse its
+    HTTP connection instead of setting up a new client each time.
+    """
+    return Ollama(model=model_name, base_url=OLLAMA_BASE_URL)
+
+
+def _get_store(embedding_function):
+    """
+    Returns the vector store at FAISS_PATH, loading it only if it changed since the last query.
+
+    Keyed on the modification times of the index files, so a rebuilt or updated database is
+    picked up automatically. Only the latest version is kept.
+    """
+    key = (
+        (FAISS_PATH / "index.faiss").stat().st_mtime_ns,
+        (FAISS_PATH / "index.pkl").stat().st_mtime_ns,
+    )
+    with _store_lock:
+        db = _store_cache.get(key)
+        if db is None:
+            db = load_store(embedding_function, mmap=FAISS_MMAP, gpu=FAISS_USE_GPU)
+            _store_cache.clear()
+            _store_cache[key] = db
+        return db
+
+
+def _run_pipeline(query_text: str, k: int, threshold: float, verbose: bool, stream: bool = False):
+    """
+    Run retrieval and generation for a query.
+
+    Returns:
+        tuple: (answer, sources) on success, or None if any stage failed.
+    """
     embedding_function = get_embedding()
     
     try:
         # Load the FAISS vector database from disk
         if verbose:
             print("📂 Loading FAISS index...")
-        db = FAISS.load_local(str(FAISS_PATH), embedding_function, 
-                             allow_dangerous_deserialization=FAISS_ALLOW_DANGEROUS_DESERIALIZATION)
+        db = _get_store(embedding_function)
     except Exception as e:
         print(f"❌ Error loading FAISS index: {e}")
         print("💡 Please run populate_database.py first to create the vector database.")
@@ -93,7 +216,7 @@ def query_rag(query_text: str, k: int = DEFAULT_K, threshold: float = DEFAULT_SC
     try:
         results = db.similarity_search_with_score(query_text, k=k)
         
-        # Filter by threshold
+        # Scores are cosine similarities, higher is more relevant
         filtered_results = [(doc, score) for doc, score in results if score >= threshold]
         
         if not filtered_results:
@@ -111,6 +234,17 @@ def query_rag(query_text: str, k: int = DEFAULT_K, threshold: float = DEFAULT_SC
         print(f"❌ Error during similarity search: {e}")
         return None
 
+    return _generate_answer(query_text, filtered_results, verbose, stream)
+
+
+def _generate_answer(query_text: str, filtered_results, verbose: bool, stream: bool = False):
+    """
+    Generate an answer from retrieved documents.
+    If stream is set, the answer is printed token by token as it is generated.
+
+    Returns:
+        tuple: (answer, sources) on success, or None if generation failed.
+    """
     # Build context and check length
     context_text = "\n\n---\n\n".join([doc.page_content for doc, _score in filtered_results])
     
@@ -121,46 +255,117 @@ def query_rag(query_text: str, k: int = DEFAULT_K, threshold: float = DEFAULT_SC
 
     # Generate prompt and response
     try:
-        prompt_template = ChatPromptTemplate.from_template(PROMPT_TEMPLATE)
-        prompt = prompt_template.format(context=context_text, question=query_text)
+        prompt = render_prompt(context_text, query_text)
 
         if verbose:
             print("🤖 Generating response...")
         
-        model = Ollama(model=OLLAMA_QUERY_MODEL)
-        response_text = model.invoke(prompt)
+        model = _get_llm()
+        if stream:
+            # Print tokens as they arrive, so the answer starts appearing after the first token
+            _print_answer_header()
+            parts = []
+            for token in model.stream(prompt):
+                print(token, end="", flush=True)
+                parts.append(token)
+            print()
+            response_text = "".join(parts)
+        else:
+            response_text = model.invoke(prompt)
 
     except Exception as e:
         print(f"❌ Error generating response: {e}")
         print("💡 Check if Ollama is running and the model is available")
         return None
 
-    # Prepare response data
     sources = [doc.metadata.get("id", "Unknown") for doc, _score in filtered_results]
-    response_time = time.time() - start_time
-    
-    response_data = {
-        "answer": response_text,
-        "sources": sources,
-        "num_sources": len(sources),
-        "response_time": response_time,
-        "query": query_text
-    }
-    
-    # Format and display response
-    print("\n" + "="*50)
-    print("🤖 Answer:")
-    print(response_text)
-    print("\n" + "-"*30)
-    print(f"📚 Sources ({len(sources)}):")
-    for i, source in enumerate(sources, 1):
-        print(f"   {i}. {source}")
-    
-    if verbose:
-        print(f"⏱️  Response time: {response_time:.2f}s")
-        print("="*50)
-    
-    return response_data
+    return response_text, sources
+
+
+
+def retrieve_batch(queries: List[str], k: int = DEFAULT_K, threshold: float = DEFAULT_SCORE_THRESHOLD):
+    """
+    Retrieve relevant documents for several queries at once.
+
+    All queries are embedded in one call and searched with a single index.search(), which lets
+    FAISS batch the distance computations instead of scanning the index once per query.
+
+    Args:
+        queries: The questions to retrieve documents for.
+        k: Number of documents to retrieve per query.
+        threshold: Minimum similarity score.
+
+    Returns:
+        list: For each query, a list of (Document, score) tuples above the threshold.
+    """
+    db = _get_store(get_embedding())
+    vectors = db.embedding_function.embed_documents_array(queries)
+    scores, ids = db.index.search(vectors, k)
+
+    results = []
+    for row_scores, row_ids in zip(scores, ids):
+        hits = []
+        for score, idx in zip(row_scores, row_ids):
+            # -1 marks missing results when fewer than k vectors are reachable
+            if idx < 0 or score < threshold:
+                continue
+            doc = db.docstore.search(db.index_to_docstore_id[idx])
+            hits.append((doc, float(score)))
+        results.append(hits)
+    return results
+
+
+def query_rag_batch(queries: List[str], k: int = DEFAULT_K, threshold: float = DEFAULT_SCORE_THRESHOLD,
+                    verbose: bool = False):
+    """
+    Answer several questions, retrieving documents for all of them in one batched search.
+
+    Intended for evaluation scripts and other bulk callers: answers are returned rather than
+    printed, and the semantic cache is bypassed so every answer reflects the current documents.
+
+    Args:
+        queries: The questions to ask.
+        k: Number of documents to retrieve per question.
+        threshold: Minimum similarity score.
+        verbose: Whether to print detailed info.
+
+    Returns:
+        list: One result dict per question (same keys as query_rag), or None for questions
+            that had no relevant documents or failed.
+    """
+    import time
+    start_time = time.time()
+
+    try:
+        retrieved = retrieve_batch(queries, k, threshold)
+    except Exception as e:
+        print(f"❌ Error during batched retrieval: {e}")
+        return [None] * len(queries)
+
+    responses = []
+    for query_text, filtered_results in zip(queries, retrieved):
+        if not filtered_results:
+            if verbose:
+                print(f"❌ No documents found above similarity threshold {threshold} for: {query_text}")
+            responses.append(None)
+            continue
+
+        result = _generate_answer(query_text, filtered_results, verbose)
+        if result is None:
+            responses.append(None)
+            continue
+
+        response_text, sources = result
+        responses.append({
+            "answer": response_text,
+            "sources": sources,
+            "num_sources": len(sources),
+            "response_time": time.time() - start_time,
+            "query": query_text,
+            "cached": False
+        })
+
+    return responses
 
 
 if __name__ == "__main__":
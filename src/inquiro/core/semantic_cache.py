@@ -0,0 +1,252 @@
+"""
+Semantic answer cache for the RAG pipeline.
+
+Questions are embedded and compared against the embeddings of previously answered questions.
+If a prior question is similar enough (cosine similarity at or above SEMANTIC_CACHE_THRESHOLD),
+its answer is returned directly, skipping retrieval and LLM generation. A question asked again
+verbatim (ignoring case and whitespace) is answered from a dict without being embedded at all.
+
+Every entry records the scope it was answered in: the query model, k, the score threshold and
+the version of the vector index (see query._cache_scope()). An entry is only served for the
+same scope, so answers never outlive the document set or settings they were generated with.
+
+Cached entries are kept in a small in-memory FAISS inner-product index and persisted as JSONL,
+one entry per line, so they survive across processes. The file is re-read whenever it changed on
+disk, e.g. because another process cleared the cache after rebuilding the database. Entries older
+than SEMANTIC_CACHE_TTL_DAYS are ignored.
+
+The file is only appended to, so expired entries and entries for an older version of the index
+(the "index" field of their scope) pile up in it. Whenever it has doubled in length since it was
+last compacted, store() rewrites it with only the entries that can still be served.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import List, Optional
+
+import faiss
+import numpy as np
+
+from .embedding import get_embedding
+from .config import (
+    SEMANTIC_CACHE_PATH,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL_DAYS
+)
+
+# Number of nearest cached questions checked for one answered in the same scope
+_SEARCH_CANDIDATES = 8
+
+# Minimum number of lines in the cache file before it is compacted
+_COMPACT_MIN_LINES = 200
+
+_lock = threading.Lock()
+_loaded = False
+_signature = None   # (inode, mtime, size) of SEMANTIC_CACHE_PATH as last read or written, see _load()
+_index = None       # faiss.IndexFlatIP over L2-normalized question embeddings
+_entries = []       # Cached entries, parallel to the rows of _index
+_exact = {}         # (scope, normalized question) -> its newest entry, see _exact_key()
+_file_lines = 0     # Entries in SEMANTIC_CACHE_PATH, including expired ones
+_compacted_lines = 0  # Entries left by the last compaction in this process, see _maybe_compact()
+
+
+def _exact_key(question: str, scope: dict) -> tuple:
+    """Key of a question in a scope, with case and runs of whitespace in the question ignored."""
+    return json.dumps(scope, sort_keys=True), " ".join(question.lower().split())
+
+
+def _normalize(vector: List[float]) -> np.ndarray:
+    """Return the embedding as a (1, d) float32 array with unit L2 norm."""
+    matrix = np.asarray([vector], dtype=np.float32)
+    faiss.normalize_L2(matrix)
+    return matrix
+
+
+def _is_expired(entry: dict, now: float) -> bool:
+    if SEMANTIC_CACHE_TTL_DAYS <= 0:
+        return False
+    return now - entry["created"] > SEMANTIC_CACHE_TTL_DAYS * 86400
+
+
+def _file_signature():
+    """Identifies the current contents of the cache file, or None if there is none."""
+    try:
+        stat = os.stat(SEMANTIC_CACHE_PATH)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _reset() -> None:
+    global _index
+    _index = None
+    _entries.clear()
+    _exact.clear()
+
+
+def _add_entry(entry: dict) -> None:
+    global _index
+    matrix = _normalize(entry["embedding"])
+    if _index is None or _index.d != matrix.shape[1]:
+        _reset()
+        _index = faiss.IndexFlatIP(matrix.shape[1])
+    _index.add(matrix)
+    _entries.append(entry)
+    _exact[_exact_key(entry["question"], entry.get("scope"))] = entry
+
+
+def _load() -> None:
+    """Load unexpired entries from disk, on first use and whenever the file changed since."""
+    global _loaded, _signature, _file_lines, _compacted_lines
+    signature = _file_signature()
+    if _loaded and signature == _signature:
+        return
+    _loaded = True
+    _signature = signature
+    _file_lines = _compacted_lines = 0
+    _reset()
+    if signature is None:
+        return
+
+    now = time.time()
+    try:
+        with open(SEMANTIC_CACHE_PATH, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                _file_lines += 1
+                entry = json.loads(line)
+                if not _is_expired(entry, now):
+                    _add_entry(entry)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Warning: Could not load semantic cache ({e}), starting empty")
+        _reset()
+
+
+def lookup(question: str, scope: dict) -> Optional[dict]:
+    """
+    Look up a previously answered question that is semantically similar.
+
+    Args:
+        question: The user's question.
+        scope: JSON-serializable settings the answer depends on; only entries stored
+            with an equal scope are returned.
+
+    Returns:
+        dict: The cached entry (with "answer" and "sources"), or None on a cache miss.
+    """
+    with _lock:
+        _load()
+        entry = _exact.get(_exact_key(question, scope))
+        if entry is not None and not _is_expired(entry, time.time()):
+            return entry
+
+    vector = _normalize(get_embedding().embed_query(question))
+
+    with _lock:
+        _load()
+        if _index is None or _index.ntotal == 0 or _index.d != vector.shape[1]:
+            return None
+
+        scores, ids = _index.search(vector, min(_SEARCH_CANDIDATES, _index.ntotal))
+        now = time.time()
+        for score, idx in zip(scores[0], ids[0]):
+            if idx < 0 or score < SEMANTIC_CACHE_THRESHOLD:
+                break
+            entry = _entries[idx]
+            if entry.get("scope") == scope and not _is_expired(entry, now):
+                return entry
+        return None
+
+
+def store(question: str, answer: str, sources: List[str], scope: dict) -> None:
+    """
+    Cache the answer to a question for future semantic lookups.
+
+    Args:
+        question: The user's question.
+        answer: The generated answer.
+        sources: The source chunk IDs the answer was based on.
+        scope: The settings the answer was generated with, see lookup().
+    """
+    global _signature, _file_lines
+    entry = {
+        "question": question,
+        "answer": answer,
+        "sources": sources,
+        "scope": scope,
+        "created": time.time(),
+        "embedding": get_embedding().embed_query(question),
+    }
+
+    with _lock:
+        _load()
+        _add_entry(entry)
+        try:
+            SEMANTIC_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(SEMANTIC_CACHE_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            # Our own append doesn't need a reload
+            _signature = _file_signature()
+            _file_lines += 1
+            _maybe_compact(scope)
+        except OSError as e:
+            print(f"Warning: Could not persist semantic cache entry: {e}")
+
+
+def _maybe_compact(scope: dict) -> None:
+    """
+    Rewrite the cache file without the entries that can't be served anymore: expired ones and
+    those answered for another version of the index than `scope`, the scope of the newest entry.
+    
+    Runs once the file has at least _COMPACT_MIN_LINES entries and twice as many as after the
+    previous compaction, so appending stays amortized constant time. The new file replaces the
+    old one atomically; other processes notice the change and reload it.
+    """
+    global _signature, _file_lines, _compacted_lines
+    if _file_lines < max(_COMPACT_MIN_LINES, 2 * _compacted_lines):
+        return
+
+    now = time.time()
+    kept = [
+        entry for entry in _entries
+        if entry.get("scope") is not None
+        and entry["scope"].get("index") == scope.get("index")
+        and not _is_expired(entry, now)
+    ]
+    fd, tmp_path = tempfile.mkstemp(dir=SEMANTIC_CACHE_PATH.parent, prefix=".qa-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for entry in kept:
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, SEMANTIC_CACHE_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _reset()
+    for entry in kept:
+        _add_entry(entry)
+    _signature = _file_signature()
+    _file_lines = _compacted_lines = len(kept)
+
+
+def clear() -> None:
+    """
+    Drop all cached answers, both in memory and on disk.
+    Called whenever the vector database is rebuilt or cleared.
+    """
+    global _loaded, _signature, _file_lines, _compacted_lines
+    with _lock:
+        _reset()
+        _loaded = True
+        _signature = None
+        _file_lines = _compacted_lines = 0
+        if SEMANTIC_CACHE_PATH.exists():
+            SEMANTIC_CACHE_PATH.unlink()
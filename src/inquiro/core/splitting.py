@@ -0,0 +1,77 @@
+"""
+Text splitters used to chunk documents before embedding.
+
+The default "recursive" splitter is LangChain's RecursiveCharacterTextSplitter, which respects
+paragraph and sentence boundaries. "recursive_token" keeps those boundaries but measures chunks
+in tiktoken tokens instead of characters, so chunk sizes track what the embedding model
+actually sees regardless of language or content type. The "token" splitter tokenizes each
+document once with tiktoken and cuts fixed-size, overlapping token windows whose boundaries are
+computed with integer arithmetic, which is much faster on large corpora. In both token modes
+CHUNK_SIZE and CHUNK_OVERLAP are counted in tokens rather than characters.
+"""
+
+from typing import List
+
+import numpy as np
+from langchain_text_splitters import RecursiveCharacterTextSplitter, TextSplitter
+
+from .config import CHUNK_SIZE, CHUNK_OVERLAP, CHUNK_SPLITTER
+
+# Encoding used by the token splitter
+TOKEN_ENCODING = "cl100k_base"
+
+
+class TokenWindowSplitter(TextSplitter):
+    """
+    Splits text into fixed-size windows of tokens.
+
+    Each text is encoded in a single tokenizer pass; window start offsets are an arange over
+    the token ids, and each window is decoded back to text.
+    """
+
+    def __init__(self, encoding_name: str = TOKEN_ENCODING, **kwargs):
+        super().__init__(**kwargs)
+        import tiktoken
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def split_text(self, text: str) -> List[str]:
+        ids = self._encoding.encode(text)
+        if not ids:
+            return []
+
+        step = self._chunk_size - self._chunk_overlap
+        # Stop once a window reaches the end, so the tail isn't repeated as a tiny chunk
+        last_start = max(len(ids) - self._chunk_overlap, 1)
+        starts = np.arange(0, last_start, step)
+        return [self._encoding.decode(ids[start:start + self._chunk_size]) for start in starts]
+
+
+def get_text_splitter() -> TextSplitter:
+    """
+    Returns the text splitter selected by CHUNK_SPLITTER.
+
+    Falls back to the recursive character splitter if a token-based splitter is selected but
+    tiktoken is not installed or its encoding cannot be loaded.
+    """
+    if CHUNK_SPLITTER in ("token", "recursive_token"):
+        try:
+            if CHUNK_SPLITTER == "recursive_token":
+                return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+                    encoding_name=TOKEN_ENCODING,
+                    chunk_size=CHUNK_SIZE,
+                    chunk_overlap=CHUNK_OVERLAP,
+                )
+            return TokenWindowSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+        except ImportError:
+            print("Warning: tiktoken not available, falling back to recursive character splitting")
+            print("Run: pip install tiktoken to enable token-based chunking")
+        except Exception as e:
+            # tiktoken downloads the encoding on first use, which fails when offline
+            print(f"Warning: Could not load {TOKEN_ENCODING} encoding ({e}), falling back to recursive character splitting")
+
+    return RecursiveCharacterTextSplitter(
+        chunk_size=CHUNK_SIZE,
+        chunk_overlap=CHUNK_OVERLAP,
+        length_function=len,
+        is_separator_regex=False,
+    )
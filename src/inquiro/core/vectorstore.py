@@ -0,0 +1,412 @@
+"""
+FAISS index management shared by database population and querying.
+
+Embeddings are L2-normalized once when they are generated and stored in an inner-product index,
+so search scores are cosine similarities that can be compared to DEFAULT_SCORE_THRESHOLD
+directly. Use create_store() and load_store() rather than the FAISS constructors, so both sides
+agree on the metric.
+
+LangChain's FAISS wrapper builds an exhaustive flat index. That is exact and is the default, but
+search cost and memory grow linearly with the number of chunks. Setting FAISS_INDEX_TYPE opts in
+to converting large flat indices into a compressed index before they are saved; the matching
+search-time parameters are applied after they are loaded. Three compressed layouts are supported:
+
+- ivfpq: inverted file with product quantization. Sub-linear search, ~16x smaller vectors.
+- sq8: exhaustive search over 8-bit scalar-quantized vectors. 4x smaller, near-lossless.
+- sqfp16: exhaustive search over half-precision vectors. 2x smaller, practically lossless.
+"""
+
+import math
+import os
+import pickle
+import tempfile
+import uuid
+from typing import List, Optional, Set
+
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from .config import (
+    FAISS_PATH,
+    FAISS_ALLOW_DANGEROUS_DESERIALIZATION,
+    FAISS_INDEX_TYPE,
+    IVF_THRESHOLD,
+    FAISS_NLIST,
+    FAISS_NPROBE,
+    FAISS_PQ_M,
+    FAISS_GPU_FP16,
+    FAISS_GPU_MIN_VECTORS
+)
+
+# Older FAISS releases only support memory-mapping the inverted lists of IVF indices
+_MMAP_IO_FLAGS = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+
+# GPU memory/stream pool, created on first use and shared by all GPU indices
+_gpu_resources = None
+
+# FAISS warns (and clusters poorly) below 39 training points per IVF cell
+_MIN_POINTS_PER_CELL = 39
+
+# Training an 8-bit PQ codebook needs at least 2^8 vectors
+_MIN_PQ_TRAINING_VECTORS = 256
+
+# Upper bound on the number of vectors used to train the coarse quantizer and codebooks
+_MAX_TRAINING_VECTORS = 100_000
+
+
+class UnitNormEmbeddings(Embeddings):
+    """
+    Wraps an embedding model so every vector it returns has unit L2 norm.
+
+    Documents are normalized once at index time and queries with a single small op per search,
+    so the inner product computed by FAISS is exactly the cosine similarity.
+    """
+
+    def __init__(self, underlying: Embeddings):
+        self.underlying = underlying
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embed_documents_array(texts).tolist()
+
+    def embed_documents_array(self, texts: List[str]) -> np.ndarray:
+        """Embeds texts into a contiguous (N, d) float32 array with unit-norm rows."""
+        if hasattr(self.underlying, "embed_documents_array"):
+            vectors = self.underlying.embed_documents_array(texts)
+        else:
+            vectors = np.asarray(self.underlying.embed_documents(texts), dtype=np.float32)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.size:
+            faiss.normalize_L2(vectors)
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = np.asarray(self.underlying.embed_query(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm > 0 else vector).tolist()
+
+
+def embed_documents(documents: List[Document], embedding_function: Embeddings) -> np.ndarray:
+    """
+    Embed documents the way the vector store does, without adding them anywhere.
+
+    Returns:
+        np.ndarray: (N, d) float32 matrix of unit-norm vectors, for create_store() or add_documents().
+    """
+    return UnitNormEmbeddings(embedding_function).embed_documents_array([doc.page_content for doc in documents])
+
+
+def create_store(documents: List[Document], embedding_function: Embeddings, vectors: Optional[np.ndarray] = None) -> FAISS:
+    """
+    Embed documents into a new cosine-similarity vector store.
+
+    Args:
+        documents: Chunks to embed.
+        embedding_function: The embedding model from get_embedding().
+        vectors: The documents' embeddings from embed_documents(), if already computed.
+
+    Returns:
+        FAISS vector store backed by an IndexFlatIP over normalized vectors.
+    """
+    embeddings = UnitNormEmbeddings(embedding_function)
+    if vectors is None:
+        vectors = embeddings.embed_documents_array([doc.page_content for doc in documents])
+    db = FAISS(
+        embeddings,
+        faiss.IndexFlatIP(vectors.shape[1]),
+        InMemoryDocstore(),
+        {},
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+    )
+    _add_vectors(db, documents, vectors)
+    return db
+
+
+def add_documents(db: FAISS, documents: List[Document], vectors: Optional[np.ndarray] = None) -> None:
+    """
+    Embed documents and append them to an existing vector store.
+
+    Unlike FAISS.add_documents(), the embeddings stay in one float32 array from the
+    embedding model to the index, instead of a list of lists that is copied again.
+    Pass `vectors` from embed_documents() to skip embedding.
+    """
+    if documents:
+        if vectors is None:
+            vectors = db.embedding_function.embed_documents_array([doc.page_content for doc in documents])
+        _add_vectors(db, documents, vectors)
+
+
+def _add_vectors(db: FAISS, documents: List[Document], vectors: np.ndarray) -> None:
+    """
+    Add precomputed vectors to the index and their documents to the docstore.
+
+    Docstore keys are random, like FAISS.add_documents() assigns them; chunks are identified by
+    their "id" metadata instead (see chunk_ids()).
+    """
+    ids = [str(uuid.uuid4()) for _ in documents]
+
+    db.index.add(vectors)
+    db.docstore.add({
+        id_: Document(page_content=doc.page_content, metadata=doc.metadata)
+        for id_, doc in zip(ids, documents)
+    })
+    start = len(db.index_to_docstore_id)
+    db.index_to_docstore_id.update((start + offset, id_) for offset, id_ in enumerate(ids))
+
+
+def load_store(embedding_function: Embeddings, mmap: bool = False, gpu: bool = False) -> FAISS:
+    """
+    Load the vector store saved at FAISS_PATH and apply search-time parameters.
+
+    Args:
+        embedding_function: The embedding model from get_embedding().
+        mmap: Memory-map the index file instead of reading it into RAM. The pages are served
+            from the OS page cache and shared between processes, but the index is read-only,
+            so only use this for querying.
+        gpu: Move the index to the first GPU if one is available (requires faiss-gpu) and it
+            holds at least FAISS_GPU_MIN_VECTORS vectors. Below that, copying the index and
+            launching kernels costs more than a CPU search. GPU indices are read-only here as well.
+
+    Raises:
+        ValueError: If deserialization is not allowed, or the index was built with L2 distance
+            by an older version and has to be rebuilt.
+    """
+    if not FAISS_ALLOW_DANGEROUS_DESERIALIZATION:
+        raise ValueError("loading the index requires FAISS_ALLOW_DANGEROUS_DESERIALIZATION=true")
+
+    # Same layout as FAISS.save_local(): the raw index plus a pickled docstore
+    index = faiss.read_index(str(FAISS_PATH / "index.faiss"), _MMAP_IO_FLAGS if mmap else 0)
+    if index.metric_type != faiss.METRIC_INNER_PRODUCT:
+        raise ValueError("index uses L2 distance, rebuild the database with --reset to enable cosine search")
+    with open(FAISS_PATH / "index.pkl", "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+
+    db = FAISS(
+        UnitNormEmbeddings(embedding_function),
+        index,
+        docstore,
+        index_to_docstore_id,
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+    )
+    configure_search(db)
+    if gpu and db.index.ntotal >= FAISS_GPU_MIN_VECTORS:
+        db.index = _index_to_gpu(db.index)
+    return db
+
+
+def save_store(db: FAISS) -> None:
+    """
+    Save the vector store to FAISS_PATH, in the same layout as FAISS.save_local().
+
+    Each file is written to a temporary file next to it and then renamed over the old one.
+    Queries memory-map index.faiss, and truncating a mapped file in place kills the mapping
+    process with SIGBUS on its next search; after a rename it keeps reading the old file.
+    """
+    FAISS_PATH.mkdir(parents=True, exist_ok=True)
+    _replace_file(FAISS_PATH / "index.faiss", lambda path: faiss.write_index(db.index, path))
+
+    def write_docstore(path):
+        with open(path, "wb") as f:
+            pickle.dump((db.docstore, db.index_to_docstore_id), f)
+    _replace_file(FAISS_PATH / "index.pkl", write_docstore)
+
+
+def _replace_file(target, write) -> None:
+    """Call write(path) on a temporary file in target's directory, then rename it to target."""
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def count_vectors() -> int:
+    """
+    Number of vectors (chunks) in the index saved at FAISS_PATH.
+
+    The index is memory-mapped, so this only reads the file header and whatever the
+    index type keeps outside its mapped storage, not the vectors themselves.
+    """
+    return faiss.read_index(str(FAISS_PATH / "index.faiss"), _MMAP_IO_FLAGS).ntotal
+
+
+def _index_to_gpu(index):
+    """
+    Copy an index to GPU 0, sharing one StandardGpuResources object per process.
+    Returns the CPU index unchanged if no GPU is available or the index type isn't supported.
+    """
+    global _gpu_resources
+    if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0:
+        return index
+
+    try:
+        if _gpu_resources is None:
+            _gpu_resources = faiss.StandardGpuResources()
+        options = faiss.GpuClonerOptions()
+        options.useFloat16 = FAISS_GPU_FP16
+        return faiss.index_cpu_to_gpu(_gpu_resources, 0, index, options)
+    except Exception as e:
+        print(f"Warning: Could not move FAISS index to GPU ({e}), searching on CPU")
+        return index
+
+
+def _default_nlist(count: int) -> int:
+    """
+    Number of IVF cells for a collection of the given size: about 4*sqrt(N), but never so
+    many that k-means has fewer than _MIN_POINTS_PER_CELL training points per cell.
+    """
+    return max(1, min(int(4 * math.sqrt(count)), count // _MIN_POINTS_PER_CELL))
+
+
+def chunk_ids(db: FAISS) -> Set[str]:
+    """
+    The "id" metadata (see database.calculate_chunk_ids) of every chunk in the store.
+
+    Docstore keys are random, so the IDs are read from the documents themselves.
+    """
+    return {
+        db.docstore.search(doc_id).metadata.get("id")
+        for doc_id in db.index_to_docstore_id.values()
+    }
+
+
+def remove_sources(db: FAISS, sources: List[str]) -> int:
+    """
+    Delete every chunk whose "source" metadata is one of the given files.
+
+    FAISS.delete() renumbers index_to_docstore_id to 0..n-1. Flat and scalar-quantized
+    indices shift their vectors down to match, but IVF indices keep each vector's original
+    id, so their ids are renumbered here to agree with the mapping again.
+
+    Returns:
+        int: The number of chunks removed.
+    """
+    sources = set(sources)
+    ids = {
+        doc_id for doc_id in db.index_to_docstore_id.values()
+        if db.docstore.search(doc_id).metadata.get("source") in sources
+    }
+    if not ids:
+        return 0
+
+    # Index ids of the surviving vectors, in the order FAISS.delete() renumbers them
+    kept = [i for i, doc_id in sorted(db.index_to_docstore_id.items()) if doc_id not in ids]
+    db.delete(list(ids))
+    if isinstance(db.index, faiss.IndexIVF):
+        _renumber_ivf(db.index, kept)
+    return len(ids)
+
+
+def _renumber_ivf(index, kept: List[int]) -> None:
+    """
+    Give the vectors of an IVF index the ids 0..n-1, in the order of `kept` (their current ids).
+
+    Only the ids stored in the inverted lists change; the codes are copied back unchanged,
+    so no vector is re-encoded. Vectors added afterwards get ids from ntotal on, as usual.
+    """
+    new_ids = np.full(max(kept, default=-1) + 1, -1, dtype=np.int64)
+    new_ids[kept] = np.arange(len(kept), dtype=np.int64)
+
+    invlists = index.invlists
+    for list_no in range(index.nlist):
+        size = invlists.list_size(list_no)
+        if size == 0:
+            continue
+        old = faiss.rev_swig_ptr(invlists.get_ids(list_no), size)
+        renumbered = np.ascontiguousarray(new_ids[old])
+        codes = faiss.rev_swig_ptr(invlists.get_codes(list_no), size * invlists.code_size).copy()
+        invlists.update_entries(list_no, 0, size, faiss.swig_ptr(renumbered), faiss.swig_ptr(codes))
+
+    if index.direct_map.type != faiss.DirectMap.NoMap:
+        index.make_direct_map()
+
+
+def _pq_subquantizers(dimension: int) -> int:
+    """Largest number of PQ sub-quantizers <= FAISS_PQ_M that divides the dimension."""
+    m = max(1, min(FAISS_PQ_M, dimension))
+    while dimension % m:
+        m -= 1
+    return m
+
+
+def build_ivfpq_index(vectors: np.ndarray):
+    """
+    Train and populate an IVF-PQ index for the given vectors.
+
+    Args:
+        vectors: (N, d) float32 matrix, in docstore order.
+
+    Returns:
+        faiss.IndexIVFPQ containing all vectors with ids 0..N-1.
+    """
+    count, dimension = vectors.shape
+    nlist = FAISS_NLIST if FAISS_NLIST > 0 else _default_nlist(count)
+    m = _pq_subquantizers(dimension)
+
+    quantizer = faiss.IndexFlatIP(dimension)
+    index = faiss.IndexIVFPQ(quantizer, dimension, nlist, m, 8, faiss.METRIC_INNER_PRODUCT)
+
+    if count > _MAX_TRAINING_VECTORS:
+        sample = np.random.default_rng(0).choice(count, _MAX_TRAINING_VECTORS, replace=False)
+        index.train(vectors[np.sort(sample)])
+    else:
+        index.train(vectors)
+
+    index.add(vectors)
+    index.nprobe = FAISS_NPROBE
+    return index
+
+
+def build_sq_index(vectors: np.ndarray, quantizer_type=faiss.ScalarQuantizer.QT_8bit):
+    """
+    Train and populate a scalar-quantized index for the given vectors.
+
+    Args:
+        vectors: (N, d) float32 matrix, in docstore order.
+        quantizer_type: faiss.ScalarQuantizer.QT_8bit (1 byte/dim) or QT_fp16 (2 bytes/dim).
+
+    Returns:
+        faiss.IndexScalarQuantizer containing all vectors with ids 0..N-1.
+    """
+    index = faiss.IndexScalarQuantizer(vectors.shape[1], quantizer_type, faiss.METRIC_INNER_PRODUCT)
+    index.train(vectors)
+    index.add(vectors)
+    return index
+
+
+def compact_index(db: FAISS) -> None:
+    """
+    Replace the flat index of a vector store with a compressed index once it is large enough.
+
+    Vector order is preserved, so the existing index_to_docstore_id mapping stays valid.
+    Does nothing if FAISS_INDEX_TYPE is "flat", the index is already compressed, or it
+    holds fewer than IVF_THRESHOLD vectors (or too few to train a codebook).
+    """
+    if FAISS_INDEX_TYPE == "flat" or not isinstance(db.index, faiss.IndexFlat):
+        return
+    if db.index.ntotal < max(IVF_THRESHOLD, _MIN_PQ_TRAINING_VECTORS):
+        return
+
+    vectors = db.index.reconstruct_n(0, db.index.ntotal)
+    if FAISS_INDEX_TYPE == "sq8":
+        print(f"Building SQ8 index for {db.index.ntotal} vectors...")
+        db.index = build_sq_index(vectors, faiss.ScalarQuantizer.QT_8bit)
+    elif FAISS_INDEX_TYPE == "sqfp16":
+        print(f"Building SQfp16 index for {db.index.ntotal} vectors...")
+        db.index = build_sq_index(vectors, faiss.ScalarQuantizer.QT_fp16)
+    else:
+        print(f"Building IVF-PQ index for {db.index.ntotal} vectors...")
+        db.index = build_ivfpq_index(vectors)
+
+
+def configure_search(db: FAISS) -> None:
+    """Apply search-time parameters to a loaded vector store."""
+    if isinstance(db.index, faiss.IndexIVF):
+        db.index.nprobe = FAISS_NPROBE
@@ -1,28 +1,271 @@
 from textual.app import App, ComposeResult
-from textual.widgets import Header, Footer, Button, Static, Input, ProgressBar, Label, SelectionList
+from textual.widgets import Header, Footer, Button, Static, Input, ProgressBar, Label, SelectionList, RichLog
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
-from textual.reactive import reactive
 from textual.screen import Screen, ModalScreen
 from textual.message import Message
-from textual import on
+from textual import on, work
 import os
 import asyncio
-import subprocess
 import sys
-from datetime import datetime
+import time
 import threading
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 
-from .core.config import FAISS_PATH, DATA_PATH
+from .core.config import FAISS_PATH, DATA_PATH, MOVE_ON_ADD
 
-# Import our backend functions
-try:
-    from .core.query import query_rag
-    from .core.database import main as populate_main, clear_database
-except ImportError as e:
-    print(f"Warning: Could not import backend functions: {e}")
-    query_rag = None
-    populate_main = None
+# The database is ready once its index file exists (which implies FAISS_PATH does too)
+INDEX_FILE = str(FAISS_PATH / 'index.faiss')
+
+# DATA_PATH as a plain string, for the per-file path joins of the file management actions
+DATA_DIR = os.path.abspath(DATA_PATH)
+
+# File extensions (lowercase) of the documents that can be added to DATA_PATH
+DOCUMENT_EXTENSIONS = frozenset({'.pdf', '.txt', '.md'})
+
+# Number of files copied into DATA_PATH at once
+COPY_WORKERS = 8
+
+# Read/write block size when copying without a kernel copy call (8 MB)
+COPY_BUFFER_SIZE = 8 << 20
+
+# Number of files added to the removal dialog's list per refresh
+FILE_LIST_PAGE_SIZE = 100
+
+# Number of chat lines kept in the scrollback
+MAX_CHAT_LINES = 500
+
+# How long (in seconds) a check for INDEX_FILE is trusted before the filesystem is asked again
+FAISS_PROBE_TTL = 2.0
+
+# Our backend functions. Importing them pulls in LangChain, Ollama and FAISS, which takes
+# about a second, so it happens in the background once the UI is up (see load_backend()).
+query_rag = None
+populate_main = None
+clear_database = None
+_backend_loaded = False
+_backend_lock = threading.Lock()
+
+
+def load_backend():
+    """
+    Import the backend functions on first use. Safe to call from any thread; the
+    functions stay None if the backend can't be imported.
+    """
+    global query_rag, populate_main, clear_database, _backend_loaded
+    with _backend_lock:
+        if _backend_loaded:
+            return
+        try:
+            from .core.query import query_rag
+            from .core.database import main as populate_main, clear_database
+        except ImportError as e:
+            print(f"Warning: Could not import backend functions: {e}")
+        _backend_loaded = True
+
+
+def _copy_contents(source, destination):
+    """
+    Copy a file's contents (not its metadata).
+    
+    shutil.copyfile hands the copy to the kernel on Linux (sendfile) and macOS (fcopyfile).
+    Elsewhere it loops over 1 MB reads, so there the copy uses COPY_BUFFER_SIZE blocks instead,
+    which takes fewer system calls for large PDFs.
+    """
+    if sys.platform.startswith("linux") or sys.platform == "darwin":
+        shutil.copyfile(source, destination)
+        return
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+
+
+def _copy_one(file_path, duplicate=False, data_device=None):
+    """
+    Copy one file into DATA_PATH.
+    
+    If data_device is given (see MOVE_ON_ADD) and the file is on that device, it is moved
+    with a rename instead, which doesn't read or write its contents.
+    
+    Returns:
+        tuple: (ok, messages), where ok is True if the file was added, False if it failed
+        and None if it was skipped because it already exists.
+    """
+    messages = [(False, f"[DEBUG] Processing file: {file_path}")]
+    try:
+        filename = os.path.basename(file_path)
+        # Validate file type first, it needs no filesystem access
+        if os.path.splitext(filename)[1].lower() not in DOCUMENT_EXTENSIONS:
+            messages.append((True, f"❌ Unsupported file type: {filename}"))
+            return False, messages
+        try:
+            source = os.stat(file_path)
+        except OSError:
+            source = None
+        if source is None or not stat.S_ISREG(source.st_mode):
+            messages.append((True, f"❌ File not found: {file_path}"))
+            return False, messages
+        destination = os.path.join(DATA_DIR, filename)
+        # Check if file already exists (lexists doesn't follow symlinks)
+        if duplicate or os.path.lexists(destination):
+            messages.append((False, f"⚠️ File already exists: {filename}"))
+            return None, messages
+        if data_device is not None and source.st_dev == data_device:
+            os.replace(file_path, destination)
+            messages.append((False, f"✅ Moved: {filename}"))
+            return True, messages
+        # Copy the contents only
+        _copy_contents(file_path, destination)
+        messages.append((False, f"✅ Added: {filename}"))
+        return True, messages
+    except Exception as e:
+        messages.append((True, f"❌ Failed to copy {os.path.basename(file_path)}: {str(e)}"))
+        return False, messages
+
+
+def _copy_files(file_paths):
+    """
+    Copy files into DATA_PATH. Runs off the event loop, so it doesn't touch the UI.
+    
+    Up to COPY_WORKERS files are copied at once, so transfers from slow sources (network
+    shares, synced folders) overlap instead of queueing behind each other.
+    
+    Returns:
+        tuple: (successful, failed, messages), where messages is a list of
+        (is_error, text) to show in the chat.
+    """
+    # Ensure data directory exists
+    os.makedirs(DATA_DIR, exist_ok=True)
+    # Files on the same device as DATA_DIR can be moved rather than copied
+    data_device = os.stat(DATA_DIR).st_dev if MOVE_ON_ADD else None
+    
+    # Only the first of several selected files with the same name is copied, as before
+    seen = set()
+    duplicates = []
+    for file_path in file_paths:
+        filename = os.path.basename(file_path)
+        duplicates.append(filename in seen)
+        seen.add(filename)
+    
+    devices = [data_device] * len(file_paths)
+    workers = min(COPY_WORKERS, len(file_paths))
+    if workers <= 1:
+        results = list(map(_copy_one, file_paths, duplicates, devices))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_copy_one, file_paths, duplicates, devices))
+    
+    messages = []
+    successful = 0
+    failed = 0
+    for ok, file_messages in results:
+        messages.extend(file_messages)
+        if ok:
+            successful += 1
+        elif ok is False:
+            failed += 1
+    return successful, failed, messages
+
+
+def _scan_documents(known_mtime=None):
+    """
+    List the documents in DATA_PATH. Runs off the event loop, so it doesn't touch the UI.
+    
+    Returns:
+        tuple: (mtime, files) with the directory's modification time (None if it doesn't
+        exist) and the document names, or None if the modification time is still
+        known_mtime and the previous listing is current.
+    """
+    try:
+        mtime = os.stat(DATA_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return None, []
+    if mtime == known_mtime:
+        return None
+    
+    # scandir reports each entry's type along with its name, so is_file() needs no stat
+    try:
+        with os.scandir(DATA_DIR) as entries:
+            files = [
+                e.name for e in entries
+                if os.path.splitext(e.name)[1].lower() in DOCUMENT_EXTENSIONS and e.is_file()
+            ]
+    except FileNotFoundError:
+        # Removed after the stat above
+        return None, []
+    return mtime, files
+
+
+def _remove_files(filenames):
+    """
+    Delete files from DATA_PATH. Runs off the event loop, so it doesn't touch the UI.
+    
+    Returns:
+        tuple: (successful, failed, messages), like _copy_files().
+    """
+    messages = []
+    successful = 0
+    failed = 0
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(DATA_DIR, filename))
+            messages.append((False, f"🗑️ Removed: {filename}"))
+            successful += 1
+        except FileNotFoundError:
+            messages.append((True, f"❌ File not found: {filename}"))
+            failed += 1
+        except Exception as e:
+            messages.append((True, f"❌ Failed to remove {filename}: {str(e)}"))
+            failed += 1
+    return successful, failed, messages
+
+
+def _file_dialog_unavailable():
+    """
+    Returns why the native file dialog can't be shown, or None if it can.
+    
+    The dialog runs Tk in a worker thread. Windows and X11/Wayland allow that, but on macOS
+    Tk (through AppKit) must run on the main thread, which belongs to the TUI, and creating it
+    anywhere else aborts the whole process instead of raising an error.
+    """
+    if sys.platform == "darwin":
+        return "The file dialog is not available on macOS"
+    if sys.platform != "win32" and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        return "No graphical display for the file dialog"
+    return None
+
+
+def _ask_open_files():
+    """
+    Show the native file picker and return the selected paths.
+    
+    Tk gets its own hidden root window, created and destroyed on the calling thread.
+    Check _file_dialog_unavailable() first.
+    """
+    import tkinter
+    from tkinter import filedialog
+    
+    root = tkinter.Tk()
+    try:
+        root.withdraw()
+        root.attributes('-topmost', True)
+        return list(filedialog.askopenfilenames(
+            parent=root,
+            title="Select documents to add to Inquiro",
+            filetypes=[("Document files", "*.pdf *.txt *.md"), ("All files", "*.*")]
+        ))
+    finally:
+        root.destroy()
+
+
+def _show_messages(chat, messages):
+    """Add (is_error, text) messages to the chat, painting the screen once for all of them."""
+    with chat.app.batch_update():
+        for is_error, text in messages:
+            if is_error:
+                chat.add_error_message(text)
+            else:
+                chat.add_system_message(text)
 
 class FileManagerScreen(ModalScreen):
     """Modal screen for file management operations."""
@@ -41,7 +284,7 @@ class FileManagerScreen(ModalScreen):
             
     @on(Button.Pressed, "#add-files-btn")
     def add_files_action(self):
-        """Open Windows file explorer to select files."""
+        """Open the native file dialog to select files."""
         self.dismiss()
         context_zone = self.app.query_one(ContextManagerZone)
         chat = self.app.query_one(ChatZone)
@@ -79,8 +322,8 @@ class FileRemovalScreen(ModalScreen):
             yield Static("🗑️ Remove Files", classes="dialog-title")
             yield Static("Select files to remove:", classes="dialog-subtitle")
             
-            # Create selection list of files
-            options = [(file, file) for file in self.files]
+            # Create selection list with the first page of files; on_mount() adds the rest
+            options = [(file, file) for file in self.files[:FILE_LIST_PAGE_SIZE]]
             self.file_selection = SelectionList(*options, id="file-selection")
             yield self.file_selection
             
@@ -90,9 +333,21 @@ class FileRemovalScreen(ModalScreen):
                 classes="dialog-buttons"
             )
 
+    def on_mount(self):
+        self.call_after_refresh(self.append_files, FILE_LIST_PAGE_SIZE)
+
+    def append_files(self, start: int):
+        """Add the next page of files to the list, one page per refresh so the dialog stays responsive."""
+        page = self.files[start:start + FILE_LIST_PAGE_SIZE]
+        if not page:
+            return
+        self.file_selection.add_options([(file, file) for file in page])
+        self.call_after_refresh(self.append_files, start + FILE_LIST_PAGE_SIZE)
+
     @on(Button.Pressed, "#confirm-remove-btn")
     def confirm_remove_action(self):
-        selected_files = [self.files[i] for i in self.file_selection.selected]
+        # The selection values are the file names themselves
+        selected_files = list(self.file_selection.selected)
         self.dismiss(selected_files)
 
     @on(Button.Pressed, "#cancel-remove-btn")
@@ -123,12 +378,17 @@ class PathInputScreen(ModalScreen):
         self.dismiss(None)
 
 class ChatZone(Vertical):
-    messages = reactive([])
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._minute = None
+        self._timestamp = ""
 
     def compose(self) -> ComposeResult:
         yield Static("💬 Research Chat", classes="section-title")
-        self.message_area = Static("", classes="chat-messages", id="messages")
-        yield ScrollableContainer(self.message_area, id="chat-scroll")
+        # RichLog renders each new line once and keeps scrolling to the end, instead of
+        # re-rendering the whole history on every message
+        self.message_log = RichLog(markup=True, wrap=True, max_lines=MAX_CHAT_LINES, id="chat-log")
+        yield self.message_log
         yield Horizontal(
             Input(placeholder="Ask a question about your documents...", id="chat-input"),
             Button("Send", id="send-btn", variant="primary"),
@@ -137,26 +397,36 @@ class ChatZone(Vertical):
 
     def on_mount(self):
         self.add_system_message("Welcome! Load documents and ask questions to get started.")
+        # Warm up the backend while the user types their first question
+        self.run_worker(asyncio.to_thread(load_backend), exit_on_error=False)
+
+    def current_timestamp(self) -> str:
+        """The "HH:MM" shown next to messages, formatted once per minute."""
+        minute = int(time.time() // 60)
+        if minute != self._minute:
+            self._minute = minute
+            self._timestamp = time.strftime("%H:%M", time.localtime(minute * 60))
+        return self._timestamp
 
     def add_system_message(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M")
-        self.messages.append(f"[dim]{timestamp}[/dim] [blue]System:[/blue] {message}")
-        self.update_messages()
+        timestamp = self.current_timestamp()
+        self.message_log.write(f"[dim]{timestamp}[/dim] [blue]System:[/blue] {message}")
 
     def add_user_message(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M")
-        self.messages.append(f"[dim]{timestamp}[/dim] [green]You:[/green] {message}")
-        self.update_messages()
+        timestamp = self.current_timestamp()
+        self.message_log.write(f"[dim]{timestamp}[/dim] [green]You:[/green] {message}")
 
-    def add_assistant_message(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M")
-        self.messages.append(f"[dim]{timestamp}[/dim] [yellow]Assistant:[/yellow] {message}")
-        self.update_messages()
+    def add_assistant_message(self, message: str, sources=None):
+        timestamp = self.current_timestamp()
+        self.message_log.write(f"[dim]{timestamp}[/dim] [yellow]Assistant:[/yellow] {message}")
+        if sources:
+            # Chunk ids are "<source>:<page>:<chunk>"; list each file once, in order of relevance
+            files = dict.fromkeys(os.path.basename(source.rsplit(":", 2)[0]) for source in sources)
+            self.message_log.write(f"[dim]📚 Sources: {', '.join(files)}[/dim]")
 
     def add_error_message(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M")
-        self.messages.append(f"[dim]{timestamp}[/dim] [red]Error:[/red] {message}")
-        self.update_messages()
+        timestamp = self.current_timestamp()
+        self.message_log.write(f"[dim]{timestamp}[/dim] [red]Error:[/red] {message}")
 
     @on(Input.Submitted, "#chat-input")
     @on(Button.Pressed, "#send-btn")
@@ -170,39 +440,62 @@ class ChatZone(Vertical):
         self.add_user_message(msg)
         
         # Check if database exists
-        if not os.path.exists(FAISS_PATH):
+        if not self.app.query_one(ContextManagerZone).probe_faiss():
             self.add_error_message("No database found. Please populate the database first.")
             return
         
         # Show thinking message
         self.add_system_message("🔍 Searching documents...")
+        self.answer_question(msg)
+
+    @work(exclusive=True, group="query")
+    async def answer_question(self, msg: str):
+        """
+        Run the query in a worker thread, so the UI stays responsive while it runs.
         
-        # Run query in thread to avoid blocking UI
-        def run_query():
-            try:
-                if query_rag:
-                    response = query_rag(msg)
-                    self.app.call_from_thread(self.add_assistant_message, response)
-                else:
-                    self.app.call_from_thread(self.add_error_message, "Query function not available")
-            except Exception as e:
-                self.app.call_from_thread(self.add_error_message, f"Query failed: {str(e)}")
+        A new question cancels the worker of the previous one, so a stale answer is never shown.
+        """
+        try:
+            await asyncio.to_thread(load_backend)
+            if not query_rag:
+                self.add_error_message("Query function not available")
+                return
+            result = await asyncio.to_thread(query_rag, msg, quiet=True)
+        except Exception as e:
+            self.add_error_message(f"Query failed: {str(e)}")
+            return
         
-        threading.Thread(target=run_query, daemon=True).start()
-
-    def update_messages(self):
-        content = "\n".join(self.messages[-50:])  # Keep last 50 messages
-        self.message_area.update(content)
-        # Auto-scroll to bottom
-        self.query_one("#chat-scroll").scroll_end(animate=False)
+        if result:
+            self.add_assistant_message(result["answer"], result["sources"])
+        else:
+            self.add_error_message("No answer found, try rephrasing your question")
 
 class ContextManagerZone(Vertical):
-    files = reactive([])
-    database_status = reactive("Unknown")
+    # Plain attributes rather than reactives: nothing watches them, and the file list and
+    # status widgets are updated explicitly. self.files is always reassigned, never mutated.
+    files = []
+    database_status = "Unknown"
+    # Modification time of DATA_PATH when self.files was last scanned
+    _listing_mtime = None
+    # Result of the last INDEX_FILE check and when it was made, see probe_faiss()
+    _faiss_ready = False
+    _faiss_checked_at = 0.0
+    # The ChatZone, looked up on first use, see chat
+    _chat = None
+
+    @property
+    def chat(self) -> ChatZone:
+        """The chat zone that messages are written to."""
+        if self._chat is None:
+            self._chat = self.app.query_one(ChatZone)
+        return self._chat
 
     def on_mount(self):
+        # Paint first, then fill in the file list and status from worker threads
+        self.file_list.update("Loading...")
+        self.status_display.update("[dim]Checking...[/dim]")
         self.refresh_file_list()
-        self.update_database_status()
+        self.refresh_database_status()
 
     def compose(self) -> ComposeResult:
         yield Static("📁 Document Context", classes="section-title")
@@ -227,24 +520,58 @@ class ContextManagerZone(Vertical):
             classes="button-group"
         )
 
-    def refresh_file_list(self):
-        """Update the file list from the data directory."""
-        if os.path.exists(DATA_PATH):
-            all_files = os.listdir(DATA_PATH)
-            self.files = [f for f in all_files if f.endswith(('.pdf', '.txt', '.md'))]
-        else:
-            self.files = []
+    @work(exclusive=True, group="listing")
+    async def refresh_file_list(self, force: bool = False, announce: bool = False):
+        """
+        Update the file list from the data directory.
         
-        if self.files:
-            file_display = "\n".join([f"• {f}" for f in self.files])
-        else:
-            file_display = f"No documents found in {DATA_PATH}"
+        The directory is scanned in a worker thread, so a slow (e.g. network) drive doesn't
+        freeze the UI, and only if its modification time changed since the last scan (files
+        were added, removed or renamed) or force is set. If announce is set, the outcome is
+        reported in the chat once the scan has finished.
+        """
+        try:
+            scan = await asyncio.to_thread(_scan_documents, None if force else self._listing_mtime)
+        except Exception as e:
+            self.chat.add_error_message(f"Could not list files in {DATA_DIR}: {e}")
+            return
         
-        self.file_list.update(file_display)
+        if scan is not None:
+            self._listing_mtime, self.files = scan
+            
+            if self.files:
+                file_display = "\n".join([f"• {f}" for f in self.files])
+            else:
+                file_display = f"No documents found in {DATA_DIR}"
+            
+            self.file_list.update(file_display)
+        
+        if announce:
+            self.chat.add_system_message("File list refreshed")
+
+    @work(exclusive=True, group="status")
+    async def refresh_database_status(self):
+        """Check for the index in a worker thread and update the status display."""
+        self._faiss_ready = await asyncio.to_thread(os.path.isfile, INDEX_FILE)
+        self._faiss_checked_at = time.monotonic()
+        self.update_database_status()
+
+    def probe_faiss(self, force: bool = False) -> bool:
+        """
+        Returns whether the database index exists.
+        
+        The answer is cached for FAISS_PROBE_TTL seconds, so sending messages doesn't stat the
+        index every time. Populating or clearing the database invalidates it.
+        """
+        now = time.monotonic()
+        if force or now - self._faiss_checked_at >= FAISS_PROBE_TTL:
+            self._faiss_ready = os.path.isfile(INDEX_FILE)
+            self._faiss_checked_at = now
+        return self._faiss_ready
 
     def update_database_status(self):
         """Check and update database status."""
-        if os.path.exists(FAISS_PATH) and os.path.exists(os.path.join(FAISS_PATH, 'index.faiss')):
+        if self.probe_faiss():
             self.database_status = "✅ Ready"
             status_text = "[green]✅ Database Ready[/green]"
         else:
@@ -255,55 +582,71 @@ class ContextManagerZone(Vertical):
 
     @on(Button.Pressed, "#refresh-files")
     def refresh_files_action(self):
-        self.refresh_file_list()
-        self.app.query_one(ChatZone).add_system_message("File list refreshed")
+        self.refresh_file_list(announce=True)
+
+    def database_busy(self) -> bool:
+        """
+        Whether a populate or clear worker is still running.
+        
+        These can't be cancelled once their thread has started, so a second one is refused
+        rather than run against the same index concurrently.
+        """
+        return any(w.node is self and w.group == "database" and not w.is_finished for w in self.workers)
 
     @on(Button.Pressed, "#populate-db")
     def populate_database_action(self):
         if not self.files:
-            self.app.query_one(ChatZone).add_error_message("No documents found. Add PDF files to ./data directory")
+            self.chat.add_error_message(f"No documents found. Add PDF files to {DATA_DIR}")
             return
         
-        chat = self.app.query_one(ChatZone)
+        chat = self.chat
+        if self.database_busy():
+            chat.add_error_message("A database operation is already running")
+            return
         chat.add_system_message("🔄 Building database... This may take a moment.")
-        
-        def run_populate():
-            try:
-                if populate_main:
-                    # Run the populate function
-                    populate_main()
-                    self.app.call_from_thread(self.update_database_status)
-                    self.app.call_from_thread(chat.add_system_message, "✅ Database built successfully!")
-                else:
-                    self.app.call_from_thread(chat.add_error_message, "Populate function not available")
-            except Exception as e:
-                self.app.call_from_thread(chat.add_error_message, f"Database build failed: {str(e)}")
-        
-        threading.Thread(target=run_populate, daemon=True).start()
+        self.run_populate()
+
+    @work(group="database")
+    async def run_populate(self):
+        chat = self.chat
+        try:
+            await asyncio.to_thread(load_backend)
+            if not populate_main:
+                chat.add_error_message("Populate function not available")
+                return
+            # Run the populate function
+            await asyncio.to_thread(populate_main)
+        except Exception as e:
+            chat.add_error_message(f"Database build failed: {str(e)}")
+            return
+        finally:
+            self._faiss_checked_at = 0.0
+        self.refresh_database_status()
+        chat.add_system_message("✅ Database built successfully!")
 
     @on(Button.Pressed, "#clear-db")
     def clear_database_action(self):
-        def run_clear():
-            try:
-                if clear_database:
-                    clear_database()
-                    self.app.call_from_thread(self.update_database_status)
-                    self.app.call_from_thread(
-                        self.app.query_one(ChatZone).add_system_message, 
-                        "🗑️ Database cleared successfully"
-                    )
-                else:
-                    self.app.call_from_thread(
-                        self.app.query_one(ChatZone).add_error_message, 
-                        "Clear function not available"
-                    )
-            except Exception as e:
-                self.app.call_from_thread(
-                    self.app.query_one(ChatZone).add_error_message, 
-                    f"Clear failed: {str(e)}"
-                )
-        
-        threading.Thread(target=run_clear, daemon=True).start()
+        if self.database_busy():
+            self.chat.add_error_message("A database operation is already running")
+            return
+        self.run_clear()
+
+    @work(group="database")
+    async def run_clear(self):
+        chat = self.chat
+        try:
+            await asyncio.to_thread(load_backend)
+            if not clear_database:
+                chat.add_error_message("Clear function not available")
+                return
+            await asyncio.to_thread(clear_database)
+        except Exception as e:
+            chat.add_error_message(f"Clear failed: {str(e)}")
+            return
+        finally:
+            self._faiss_checked_at = 0.0
+        self.refresh_database_status()
+        chat.add_system_message("🗑️ Database cleared successfully")
         
     @on(Button.Pressed, "#manage-files")
     def manage_files_action(self):
@@ -316,50 +659,36 @@ class ContextManagerZone(Vertical):
         self.add_test_files()
 
     def open_file_explorer(self):
-        """Open Windows file explorer to select files."""
-        chat = self.app.query_one(ChatZone)
+        """Open the native file dialog to select files."""
+        chat = self.chat
         chat.add_system_message("🔍 Opening file explorer...")
+        self.run_file_dialog()
+
+    @work
+    async def run_file_dialog(self):
+        chat = self.chat
+        reason = _file_dialog_unavailable()
+        if reason:
+            chat.add_error_message(f"{reason}. Use 'Add Files by Path' instead.")
+            return
+        try:
+            # The dialog blocks until the user closes it, so wait for it off the event loop
+            files = await asyncio.to_thread(_ask_open_files)
+        except ImportError:
+            chat.add_error_message("File dialog needs tkinter, which is not installed. Use 'Add Files by Path' instead.")
+            return
+        except Exception as e:
+            chat.add_error_message(f"File explorer error: {str(e)}. Use 'Add Files by Path' instead.")
+            return
         
-        def run_file_dialog():
-            try:
-                # Try PowerShell approach first
-                ps_script = '''
-Add-Type -AssemblyName System.Windows.Forms;
-$dialog = New-Object System.Windows.Forms.OpenFileDialog;
-$dialog.Filter = "Document files (*.pdf;*.txt;*.md)|*.pdf;*.txt;*.md|All files (*.*)|*.*";
-$dialog.Multiselect = $true;
-$dialog.Title = "Select documents to add to Inquiro";
-if ($dialog.ShowDialog() -eq "OK") {
-    $dialog.FileNames
-}
-'''
-                result = subprocess.run(
-                    ["powershell", "-Command", ps_script],
-                    capture_output=True,
-                    text=True,
-                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-                )
-                # Debug output for troubleshooting
-                chat.add_system_message(f"[DEBUG] File dialog return code: {result.returncode}")
-                chat.add_system_message(f"[DEBUG] File dialog stdout: {result.stdout}")
-                chat.add_system_message(f"[DEBUG] File dialog stderr: {result.stderr}")
-                if result.returncode == 0 and result.stdout.strip():
-                    files = [f.strip() for f in result.stdout.strip().split('\n') if f.strip()]
-                    if files:
-                        self.app.call_from_thread(self.copy_files_to_data, files)
-                    else:
-                        self.app.call_from_thread(chat.add_system_message, "No files selected")
-                else:
-                    # Fallback: suggest manual path entry
-                    self.app.call_from_thread(chat.add_error_message, f"File dialog failed. Use 'Add Files by Path' instead. STDERR: {result.stderr}")
-            except Exception as e:
-                self.app.call_from_thread(chat.add_error_message, f"File explorer error: {str(e)}. Use 'Add Files by Path' instead.")
-        
-        threading.Thread(target=run_file_dialog, daemon=True).start()
+        if files:
+            self.copy_files_to_data(files)
+        else:
+            chat.add_system_message("No files selected")
 
     def show_path_input(self):
         """Show input dialog for manual path entry."""
-        chat = self.app.query_one(ChatZone)
+        chat = self.chat
         chat.add_system_message("💬 Enter file path in the dialog that appears...")
         
         def handle_path_result(path):
@@ -373,7 +702,7 @@ if ($dialog.ShowDialog() -eq "OK") {
 
     def show_file_removal(self):
         """Show file selection dialog for removal."""
-        chat = self.app.query_one(ChatZone)
+        chat = self.chat
         if not self.files:
             chat.add_error_message("❌ No files to remove")
             return
@@ -389,104 +718,63 @@ if ($dialog.ShowDialog() -eq "OK") {
         
         self.app.push_screen(FileRemovalScreen(self.files), handle_removal_result)
 
-    def copy_files_to_data(self, file_paths):
+    @work
+    async def copy_files_to_data(self, file_paths):
         """Copy selected files to the data directory."""
-        chat = self.app.query_one(ChatZone)
-        data_dir = DATA_PATH
+        chat = self.chat
         chat.add_system_message(f"[DEBUG] copy_files_to_data called with: {file_paths}")
         chat.add_system_message(f"📁 Processing {len(file_paths)} file(s)...")
-        # Ensure data directory exists
-        os.makedirs(data_dir, exist_ok=True)
-        successful = 0
-        failed = 0
-        for file_path in file_paths:
-            try:
-                chat.add_system_message(f"[DEBUG] Processing file: {file_path}")
-                if os.path.exists(file_path):
-                    filename = os.path.basename(file_path)
-                    destination = os.path.join(data_dir, filename)
-                    # Check if file already exists
-                    if os.path.exists(destination):
-                        chat.add_system_message(f"⚠️ File already exists: {filename}")
-                        continue
-                    # Validate file type
-                    if not filename.lower().endswith(('.pdf', '.txt', '.md')):
-                        chat.add_error_message(f"❌ Unsupported file type: {filename}")
-                        failed += 1
-                        continue
-                    # Copy the file
-                    shutil.copy2(file_path, destination)
-                    chat.add_system_message(f"✅ Added: {filename}")
-                    successful += 1
-                else:
-                    chat.add_error_message(f"❌ File not found: {file_path}")
-                    failed += 1
-            except Exception as e:
-                chat.add_error_message(f"❌ Failed to copy {os.path.basename(file_path)}: {str(e)}")
-                failed += 1
+        # All copies run in one worker thread; their messages are shown once it's done
+        successful, failed, messages = await asyncio.to_thread(_copy_files, file_paths)
+        
         # Update file list and show summary
-        self.refresh_file_list()
-        chat.add_system_message(f"[DEBUG] copy_files_to_data finished. Successful: {successful}, Failed: {failed}")
+        self.refresh_file_list(force=True)
+        messages.append((False, f"[DEBUG] copy_files_to_data finished. Successful: {successful}, Failed: {failed}"))
         if successful > 0:
-            chat.add_system_message(f"🎉 Successfully added {successful} file(s)!")
-            chat.add_system_message("💡 Remember to rebuild the database to include new files")
+            messages.append((False, f"🎉 Successfully added {successful} file(s)!"))
+            messages.append((False, "💡 Remember to rebuild the database to include new files"))
         if failed > 0:
-            chat.add_error_message(f"❌ Failed to add {failed} file(s)")
+            messages.append((True, f"❌ Failed to add {failed} file(s)"))
+        _show_messages(chat, messages)
 
     def add_file_by_path(self, file_path):
-        """Add a single file by path."""
-        chat = self.app.query_one(ChatZone)
+        """
+        Add a single file by path.
+        
+        The file is validated by _copy_one() in the copy worker, so the UI thread doesn't
+        stat it and the worker doesn't stat it again.
+        """
+        chat = self.chat
         
         if not file_path:
             chat.add_error_message("No file path provided")
             return
         
-        # Validate file exists and has correct extension
-        if not os.path.exists(file_path):
-            chat.add_error_message(f"File not found: {file_path}")
-            return
-        
-        if not file_path.lower().endswith(('.pdf', '.txt', '.md')):
+        if os.path.splitext(file_path)[1].lower() not in DOCUMENT_EXTENSIONS:
             chat.add_error_message("Only PDF, TXT, and MD files are supported")
             return
         
         self.copy_files_to_data([file_path])
 
-    def remove_files(self, filenames):
+    @work
+    async def remove_files(self, filenames):
         """Remove selected files from the data directory."""
-        chat = self.app.query_one(ChatZone)
-        data_dir = DATA_PATH
-        
-        successful = 0
-        failed = 0
-        
-        for filename in filenames:
-            try:
-                file_path = os.path.join(data_dir, filename)
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    chat.add_system_message(f"🗑️ Removed: {filename}")
-                    successful += 1
-                else:
-                    chat.add_error_message(f"❌ File not found: {filename}")
-                    failed += 1
-            except Exception as e:
-                chat.add_error_message(f"❌ Failed to remove {filename}: {str(e)}")
-                failed += 1
+        chat = self.chat
+        successful, failed, messages = await asyncio.to_thread(_remove_files, filenames)
         
         # Update file list and show summary
-        self.refresh_file_list()
+        self.refresh_file_list(force=True)
         if successful > 0:
-            chat.add_system_message(f"🗑️ Removed {successful} file(s) successfully")
+            messages.append((False, f"🗑️ Removed {successful} file(s) successfully"))
             # Suggest rebuilding database if files were removed
-            if successful > 0:
-                chat.add_system_message("💡 Consider rebuilding the database after removing files")
+            messages.append((False, "💡 Consider rebuilding the database after removing files"))
         if failed > 0:
-            chat.add_error_message(f"Failed to remove {failed} file(s)")
+            messages.append((True, f"Failed to remove {failed} file(s)"))
+        _show_messages(chat, messages)
 
     def add_test_files(self):
         """Add some test functionality to verify file management works."""
-        chat = self.app.query_one(ChatZone)
+        chat = self.chat
         chat.add_system_message("🧪 Testing file management functionality...")
         
         # Test 1: Check if data directory exists
@@ -540,13 +828,10 @@ class InquiroTUI(App):
         margin-bottom: 1;
     }
     
-    #chat-scroll {
+    #chat-log {
         height: 1fr;
         border: solid $surface;
         margin-bottom: 1;
-    }
-    
-    .chat-messages {
         padding: 1;
     }
     
@@ -659,7 +944,7 @@ class InquiroTUI(App):
         """Refresh the file list and database status."""
         context_zone = self.query_one(ContextManagerZone)
         context_zone.refresh_file_list()
-        context_zone.update_database_status()
+        context_zone.refresh_database_status()
         self.query_one(ChatZone).add_system_message("Interface refreshed")
 
     # @on(Button.Pressed)
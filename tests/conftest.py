@@ -0,0 +1,32 @@
+"""Shared fixtures for the Inquiro test suite."""
+
+import zlib
+from typing import List
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic random vectors keyed on the text, so tests don't need an Ollama server."""
+
+    def __init__(self, dimension: int = 16):
+        self.dimension = dimension
+        self.queries = 0
+
+    def _vector(self, text: str) -> List[float]:
+        rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+        return rng.normal(size=self.dimension).astype(np.float32).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        self.queries += 1
+        return self._vector(text)
+
+
+@pytest.fixture
+def embeddings():
+    return FakeEmbeddings()
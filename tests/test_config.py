@@ -0,0 +1,36 @@
+"""Tests for prompt template handling in inquiro.core.config."""
+
+import pytest
+
+from inquiro.core import config
+
+
+def test_default_template_renders():
+    assert config.PROMPT_TEMPLATE_PROBLEMS == []
+    prompt = config.render_prompt("CONTEXT", "QUESTION")
+    assert "CONTEXT" in prompt and "QUESTION" in prompt
+
+
+def test_literal_braces_and_repeated_fields():
+    parts, problems = config._compile_prompt("{{x}} {question} / {question}")
+    assert problems == []
+    rendered = "".join(literal + ("Q" if field else "") for literal, field in parts)
+    assert rendered == "{x} Q / Q"
+
+
+@pytest.mark.parametrize("template, fragment", [
+    ("{context} {answer}", "unknown placeholder {answer}"),
+    ("{context!r} {question}", "conversion or format spec"),
+    ("{context} {question:>10}", "conversion or format spec"),
+    ("{context} {question", "not a valid template"),
+])
+def test_invalid_template_is_reported_not_raised(monkeypatch, template, fragment):
+    parts, problems = config._compile_prompt(template)
+    assert any(fragment in p for p in problems)
+
+    monkeypatch.setattr(config, "_PROMPT_PARTS", parts)
+    monkeypatch.setattr(config, "PROMPT_TEMPLATE_PROBLEMS", problems)
+    monkeypatch.setattr(config, "SKIP_PROBE", True)
+    with pytest.raises(ValueError, match="PROMPT_TEMPLATE"):
+        config.render_prompt("c", "q")
+    assert config.validate_system() is False
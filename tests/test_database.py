@@ -0,0 +1,65 @@
+"""Tests for updating the vector database with inquiro.core.database.add_to_faiss."""
+
+import pytest
+from langchain_core.documents import Document
+
+from inquiro.core import database, manifest, vectorstore
+
+
+@pytest.fixture
+def faiss_path(tmp_path, monkeypatch, embeddings):
+    path = tmp_path / "faiss"
+    monkeypatch.setattr(database, "FAISS_PATH", path)
+    monkeypatch.setattr(vectorstore, "FAISS_PATH", path)
+    monkeypatch.setattr(manifest, "MANIFEST_PATH", path / "manifest.json")
+    monkeypatch.setattr(vectorstore, "FAISS_ALLOW_DANGEROUS_DESERIALIZATION", True)
+    monkeypatch.setattr(database, "get_embedding", lambda: embeddings)
+    return path
+
+
+def pages(source, *texts):
+    return [Document(page_content=text, metadata={"source": str(source), "page": i}) for i, text in enumerate(texts)]
+
+
+def stored_texts(embeddings):
+    db = vectorstore.load_store(embeddings)
+    return sorted(db.docstore.search(doc_id).page_content for doc_id in db.index_to_docstore_id.values())
+
+
+def test_failed_update_keeps_existing_index(faiss_path, embeddings, monkeypatch):
+    database.add_to_faiss(pages("a.pdf", "alpha", "beta"))
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("dimension mismatch")
+
+    monkeypatch.setattr(database, "add_documents", fail)
+    database.add_to_faiss(pages("b.pdf", "gamma"))
+
+    assert stored_texts(embeddings) == ["alpha", "beta"]
+
+
+@pytest.mark.parametrize("batch_size", [None, 1])
+def test_update_replaces_chunks_of_edited_files(faiss_path, embeddings, tmp_path, batch_size):
+    edited, unchanged = tmp_path / "edited.pdf", tmp_path / "unchanged.pdf"
+    edited.write_text("v1")
+    unchanged.write_text("same")
+    database.add_to_faiss(pages(edited, "old one", "old two") + pages(unchanged, "kept"), batch_size)
+
+    # Same pages and chunk positions, so every chunk ID is unchanged
+    edited.write_text("v2, edited")
+    database.add_to_faiss(pages(edited, "new one", "new two") + pages(unchanged, "kept"), batch_size)
+
+    assert stored_texts(embeddings) == ["kept", "new one", "new two"]
+
+
+def test_update_skips_unchanged_files(faiss_path, embeddings, tmp_path, monkeypatch):
+    source = tmp_path / "doc.pdf"
+    source.write_text("v1")
+    database.add_to_faiss(pages(source, "one"))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged chunks were embedded again")
+
+    monkeypatch.setattr(database, "embed_documents", fail)
+    database.add_to_faiss(pages(source, "one"))
+    assert stored_texts(embeddings) == ["one"]
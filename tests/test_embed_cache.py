@@ -0,0 +1,68 @@
+"""Tests for inquiro.core.embed_cache."""
+
+import numpy as np
+import pytest
+
+from inquiro.core.embed_cache import CachedEmbeddings
+
+
+class CountingEmbeddings:
+    """Wraps FakeEmbeddings and records every text sent to the model."""
+
+    def __init__(self, underlying):
+        self.underlying = underlying
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return self.underlying.embed_documents(texts)
+
+    def embed_query(self, text):
+        self.embedded.append(text)
+        return self.underlying.embed_query(text)
+
+
+@pytest.fixture
+def model(embeddings):
+    return CountingEmbeddings(embeddings)
+
+
+def test_only_misses_are_embedded(tmp_path, model, embeddings):
+    cache = CachedEmbeddings(model, "model-a", tmp_path / "cache.sqlite3")
+
+    first = cache.embed_documents_array(["a", "b", "a"])
+    assert sorted(model.embedded) == ["a", "b"]
+    np.testing.assert_allclose(first[0], first[2])
+    np.testing.assert_allclose(first[1], embeddings.embed_query("b"))
+
+    model.embedded.clear()
+    second = cache.embed_documents_array(["b", "c"])
+    assert model.embedded == ["c"]
+    np.testing.assert_allclose(second[0], first[1])
+
+
+def test_query_shares_cache_with_documents(tmp_path, model):
+    cache = CachedEmbeddings(model, "model-a", tmp_path / "cache.sqlite3")
+    cache.embed_documents(["question"])
+    model.embedded.clear()
+
+    cache.embed_query("question")
+    assert model.embedded == []
+
+
+def test_persists_and_is_keyed_on_model(tmp_path, model):
+    path = tmp_path / "cache.sqlite3"
+    CachedEmbeddings(model, "model-a", path).embed_documents(["text"])
+    model.embedded.clear()
+
+    CachedEmbeddings(model, "model-a", path).embed_documents(["text"])
+    assert model.embedded == []
+
+    CachedEmbeddings(model, "model-b", path).embed_documents(["text"])
+    assert model.embedded == ["text"]
+
+
+def test_empty_input(tmp_path, model):
+    cache = CachedEmbeddings(model, "model-a", tmp_path / "cache.sqlite3")
+    assert cache.embed_documents_array([]).shape[0] == 0
+    assert model.embedded == []
@@ -0,0 +1,70 @@
+"""Tests for inquiro.core.manifest."""
+
+import os
+
+import pytest
+
+from inquiro.core import manifest
+
+
+@pytest.fixture
+def manifest_path(tmp_path, monkeypatch):
+    path = tmp_path / "faiss" / "manifest.json"
+    monkeypatch.setattr(manifest, "MANIFEST_PATH", path)
+    return path
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("first version")
+    return str(path)
+
+
+def test_unchanged_file_reuses_entry_without_hashing(document, monkeypatch):
+    previous = manifest.file_entry(document)
+
+    def fail(path):
+        raise AssertionError("unchanged file was hashed again")
+
+    monkeypatch.setattr(manifest, "file_digest", fail)
+    assert manifest.file_entry(document, previous) is previous
+
+
+def test_changed_file_gets_new_digest(document):
+    previous = manifest.file_entry(document)
+    with open(document, "w") as f:
+        f.write("second, longer version")
+
+    entry = manifest.file_entry(document, previous)
+    assert entry["digest"] != previous["digest"]
+    assert entry["size"] == os.path.getsize(document)
+
+
+def test_touched_file_is_rehashed_to_same_digest(document):
+    previous = manifest.file_entry(document)
+    stat = os.stat(document)
+    os.utime(document, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    entry = manifest.file_entry(document, previous)
+    assert entry is not previous
+    assert entry["mtime_ns"] != previous["mtime_ns"]
+    assert entry["digest"] == previous["digest"]
+
+
+def test_save_load_and_clear(manifest_path, document):
+    assert manifest.load_manifest() == {}
+
+    saved = {document: manifest.file_entry(document)}
+    manifest.save_manifest(saved)
+    assert manifest.load_manifest() == saved
+
+    manifest.clear_manifest()
+    assert not manifest_path.exists()
+    assert manifest.load_manifest() == {}
+
+
+def test_corrupt_manifest_loads_empty(manifest_path):
+    manifest_path.parent.mkdir(parents=True)
+    manifest_path.write_text("{not json")
+    assert manifest.load_manifest() == {}
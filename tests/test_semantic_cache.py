@@ -0,0 +1,123 @@
+"""Tests for inquiro.core.semantic_cache."""
+
+import json
+import time
+
+import pytest
+
+from inquiro.core import semantic_cache
+
+SCOPE = {"model": "llm", "k": 7, "threshold": 0.4, "index": 1}
+
+
+class ParaphraseEmbeddings:
+    """Embeds known paraphrases to the same vector and everything else to an orthogonal one."""
+
+    vectors = {
+        "what is x?": [1.0, 0.0, 0.0],
+        "tell me what x is": [1.0, 0.01, 0.0],
+    }
+
+    def __init__(self):
+        self.queries = 0
+
+    def embed_query(self, text):
+        self.queries += 1
+        return self.vectors.get(text.lower(), [0.0, 0.0, 1.0])
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    embeddings = ParaphraseEmbeddings()
+    monkeypatch.setattr(semantic_cache, "SEMANTIC_CACHE_PATH", tmp_path / "qa.jsonl")
+    monkeypatch.setattr(semantic_cache, "get_embedding", lambda: embeddings)
+    monkeypatch.setattr(semantic_cache, "_loaded", False)
+    monkeypatch.setattr(semantic_cache, "_signature", None)
+    semantic_cache._reset()
+    yield embeddings
+    semantic_cache._reset()
+
+
+def test_miss_on_empty_cache(cache):
+    assert semantic_cache.lookup("What is X?", SCOPE) is None
+
+
+def test_hits(cache):
+    semantic_cache.store("What is X?", "an answer", ["a.pdf:0:0"], SCOPE)
+
+    queries = cache.queries
+    entry = semantic_cache.lookup("  what IS   x? ", SCOPE)
+    assert entry["answer"] == "an answer"
+    assert entry["sources"] == ["a.pdf:0:0"]
+    # Verbatim repeats are answered without embedding the question
+    assert cache.queries == queries
+
+    assert semantic_cache.lookup("Tell me what X is", SCOPE)["answer"] == "an answer"
+    assert semantic_cache.lookup("Something else", SCOPE) is None
+
+
+@pytest.mark.parametrize("change", [{"model": "other"}, {"k": 3}, {"threshold": 0.6}, {"index": 2}])
+def test_miss_in_other_scope(cache, change):
+    semantic_cache.store("What is X?", "an answer", [], SCOPE)
+    scope = {**SCOPE, **change}
+    assert semantic_cache.lookup("What is X?", scope) is None
+    assert semantic_cache.lookup("Tell me what X is", scope) is None
+
+
+def test_clear(cache):
+    semantic_cache.store("What is X?", "an answer", [], SCOPE)
+    semantic_cache.clear()
+    assert not semantic_cache.SEMANTIC_CACHE_PATH.exists()
+    assert semantic_cache.lookup("What is X?", SCOPE) is None
+
+
+def test_persists_across_processes(cache):
+    semantic_cache.store("What is X?", "an answer", [], SCOPE)
+    # A fresh process starts with nothing in memory
+    semantic_cache._reset()
+    semantic_cache._loaded = False
+    assert semantic_cache.lookup("What is X?", SCOPE)["answer"] == "an answer"
+
+
+def test_reloads_when_another_process_changes_the_file(cache):
+    semantic_cache.store("What is X?", "an answer", [], SCOPE)
+
+    # Another process clears the cache after rebuilding the database ...
+    semantic_cache.SEMANTIC_CACHE_PATH.unlink()
+    assert semantic_cache.lookup("What is X?", SCOPE) is None
+
+    # ... and then caches an answer of its own
+    entry = {
+        "question": "What is X?", "answer": "a new answer", "sources": [], "scope": SCOPE,
+        "created": time.time(), "embedding": [1.0, 0.0, 0.0],
+    }
+    semantic_cache.SEMANTIC_CACHE_PATH.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    assert semantic_cache.lookup("What is X?", SCOPE)["answer"] == "a new answer"
+
+
+def test_expired_entries_are_ignored(cache, monkeypatch):
+    semantic_cache.store("What is X?", "an answer", [], SCOPE)
+    monkeypatch.setattr(semantic_cache, "SEMANTIC_CACHE_TTL_DAYS", 1.0)
+    semantic_cache._entries[0]["created"] -= 2 * 86400
+    assert semantic_cache.lookup("What is X?", SCOPE) is None
+
+
+def test_compaction_drops_expired_and_old_index_entries(cache, monkeypatch):
+    monkeypatch.setattr(semantic_cache, "_COMPACT_MIN_LINES", 4)
+    old_index, new_index = SCOPE, {**SCOPE, "index": 2}
+
+    semantic_cache.store("q1", "old index", [], old_index)
+    semantic_cache.store("q2", "expired", [], new_index)
+    semantic_cache._entries[1]["created"] -= 30 * 86400
+    semantic_cache.store("q3", "kept", [], new_index)
+    assert len(semantic_cache.SEMANTIC_CACHE_PATH.read_text().splitlines()) == 3
+
+    semantic_cache.store("q4", "also kept", [], new_index)
+    lines = semantic_cache.SEMANTIC_CACHE_PATH.read_text().splitlines()
+    assert [json.loads(line)["answer"] for line in lines] == ["kept", "also kept"]
+
+    # Another process picks up the rewritten file
+    semantic_cache._loaded = False
+    assert semantic_cache.lookup("q1", old_index) is None
+    assert semantic_cache.lookup("q3", new_index)["answer"] == "kept"
+    assert semantic_cache.lookup("q4", new_index)["answer"] == "also kept"
@@ -0,0 +1,56 @@
+"""Tests for inquiro.core.splitting."""
+
+import pytest
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from inquiro.core import splitting
+
+
+class CharEncoding:
+    """Stands in for a tiktoken encoding with one token per character, so windows are easy to check."""
+
+    def encode(self, text):
+        return [ord(c) for c in text]
+
+    def decode(self, ids):
+        return "".join(chr(i) for i in ids)
+
+
+@pytest.fixture
+def char_tokens(monkeypatch):
+    tiktoken = pytest.importorskip("tiktoken")
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda name: CharEncoding())
+
+
+def test_recursive_splitter_is_default(monkeypatch):
+    monkeypatch.setattr(splitting, "CHUNK_SPLITTER", "recursive")
+    monkeypatch.setattr(splitting, "CHUNK_SIZE", 100)
+    monkeypatch.setattr(splitting, "CHUNK_OVERLAP", 10)
+
+    splitter = splitting.get_text_splitter()
+    assert isinstance(splitter, RecursiveCharacterTextSplitter)
+    chunks = splitter.split_text("word " * 200)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+def test_token_windows(char_tokens):
+    splitter = splitting.TokenWindowSplitter(chunk_size=4, chunk_overlap=1)
+    assert splitter.split_text("abcdefghij") == ["abcd", "defg", "ghij"]
+
+
+def test_token_windows_short_and_empty_text(char_tokens):
+    splitter = splitting.TokenWindowSplitter(chunk_size=4, chunk_overlap=1)
+    assert splitter.split_text("ab") == ["ab"]
+    assert splitter.split_text("") == []
+
+
+def test_token_splitter_falls_back_when_encoding_unavailable(monkeypatch):
+    tiktoken = pytest.importorskip("tiktoken")
+
+    def offline(name):
+        raise ConnectionError("no network")
+
+    monkeypatch.setattr(tiktoken, "get_encoding", offline)
+    monkeypatch.setattr(splitting, "CHUNK_SPLITTER", "token")
+    assert isinstance(splitting.get_text_splitter(), RecursiveCharacterTextSplitter)
@@ -0,0 +1,80 @@
+"""Tests for inquiro.core.vectorstore."""
+
+import faiss
+import pytest
+from langchain_core.documents import Document
+
+from inquiro.core import vectorstore
+
+
+def make_chunks(source, count):
+    return [
+        Document(page_content=f"{source} chunk {i}", metadata={"source": source, "page": 0, "id": f"{source}:0:{i}"})
+        for i in range(count)
+    ]
+
+
+def build_store(embeddings, index_type, monkeypatch, per_source=400):
+    """A store over five sources, compacted to the given index type."""
+    chunks = [chunk for source in "abcde" for chunk in make_chunks(source, per_source)]
+    db = vectorstore.create_store(chunks, embeddings)
+    monkeypatch.setattr(vectorstore, "FAISS_INDEX_TYPE", index_type)
+    monkeypatch.setattr(vectorstore, "IVF_THRESHOLD", 0)
+    vectorstore.compact_index(db)
+    if isinstance(db.index, faiss.IndexIVF):
+        # Search every list, so results don't depend on the coarse quantizer
+        db.index.nprobe = db.index.nlist
+    return db
+
+
+def assert_finds(db, text):
+    """The chunk is found, and nothing of the removed source "a" comes back."""
+    results = db.similarity_search(text, k=5)
+    assert text in [doc.page_content for doc in results]
+    assert all(doc.metadata["source"] != "a" for doc in results)
+
+
+@pytest.mark.parametrize("index_type", ["flat", "sq8", "ivfpq"])
+def test_remove_sources_then_search_and_add(embeddings, monkeypatch, index_type):
+    db = build_store(embeddings, index_type, monkeypatch)
+    expected = {"flat": faiss.IndexFlat, "sq8": faiss.IndexScalarQuantizer, "ivfpq": faiss.IndexIVFPQ}
+    assert isinstance(db.index, expected[index_type])
+
+    assert vectorstore.remove_sources(db, ["a"]) == 400
+    assert db.index.ntotal == len(db.index_to_docstore_id) == 1600
+    assert "a:0:0" not in vectorstore.chunk_ids(db)
+
+    # Every id the index returns must map to a remaining document
+    for text in ("b chunk 0", "c chunk 123", "e chunk 399"):
+        assert_finds(db, text)
+
+    # New vectors get ids after the surviving ones instead of colliding with them
+    vectorstore.add_documents(db, make_chunks("f", 10))
+    assert db.index.ntotal == len(db.index_to_docstore_id) == 1610
+    assert_finds(db, "f chunk 7")
+    assert_finds(db, "d chunk 42")
+
+
+def test_remove_sources_without_matches(embeddings):
+    db = vectorstore.create_store(make_chunks("a", 3), embeddings)
+    assert vectorstore.remove_sources(db, ["missing"]) == 0
+    assert db.index.ntotal == 3
+
+
+def test_save_store_leaves_mapped_index_readable(embeddings, monkeypatch, tmp_path):
+    monkeypatch.setattr(vectorstore, "FAISS_PATH", tmp_path)
+    monkeypatch.setattr(vectorstore, "FAISS_ALLOW_DANGEROUS_DESERIALIZATION", True)
+    db = build_store(embeddings, "ivfpq", monkeypatch)
+    vectorstore.save_store(db)
+    mapped = vectorstore.load_store(embeddings, mmap=True)
+    mapped.index.nprobe = mapped.index.nlist
+
+    # Rewriting the files must not pull them out from under the mapped copy
+    vectorstore.remove_sources(db, ["a"])
+    vectorstore.save_store(db)
+    results = mapped.similarity_search("b chunk 5", k=5)
+    assert "b chunk 5" in [doc.page_content for doc in results]
+
+    reloaded = vectorstore.load_store(embeddings)
+    assert reloaded.index.ntotal == 1600
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["index.faiss", "index.pkl"]